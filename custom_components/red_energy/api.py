@@ -14,6 +14,7 @@ import hashlib
 import base64
 
 import aiohttp
+from homeassistant.util.json import json_loads
 
 from .const import API_TIMEOUT, CLIENT_ID
 
@@ -46,7 +47,13 @@ class RedEnergyAPI:
     OKTA_COOKIE_DOMAINS: tuple[str, ...] = ("redenergy.okta.com", "login.redenergy.com.au")
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        session should be Home Assistant's shared session (from
+        async_get_clientsession), whose pooled keep-alive connections are
+        then reused across auth and usage requests instead of each client
+        paying its own TCP/TLS handshakes.
+        """
         self._session = session
         self._access_token: str | None = None
         self._refresh_token: str | None = None
@@ -309,7 +316,7 @@ class RedEnergyAPI:
         async with asyncio.timeout(API_TIMEOUT):
             async with self._session.get(url, headers=headers) as response:
                 response.raise_for_status()
-                return await response.json()
+                return await response.json(loads=json_loads)
     
     async def get_properties(self) -> list[dict[str, Any]]:
         """Get customer properties/accounts."""
@@ -321,7 +328,7 @@ class RedEnergyAPI:
         async with asyncio.timeout(API_TIMEOUT):
             async with self._session.get(url, headers=headers) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return data if isinstance(data, list) else data.get('properties', [])
     
     async def get_usage_data(
@@ -346,7 +353,7 @@ class RedEnergyAPI:
                 # Handle 400 Bad Request errors gracefully
                 if response.status == 400:
                     try:
-                        error_data = await response.json()
+                        error_data = await response.json(loads=json_loads)
                         error_message = error_data.get('message', 'Bad Request')
                         error_details = error_data.get('details', 'No additional details')
                     except Exception:
@@ -383,7 +390,7 @@ class RedEnergyAPI:
                 
                 # For other HTTP errors, still raise the exception
                 response.raise_for_status()
-                raw_data = await response.json()
+                raw_data = await response.json(loads=json_loads)
                 
                 # Enhanced logging for investigation
                 _LOGGER.debug("=" * 80)
@@ -441,10 +448,14 @@ class RedEnergyAPI:
             raise RedEnergyAuthError("No access token available")
         
         if self._token_expires and datetime.now() >= self._token_expires:
-            if self._refresh_token:
-                await self._refresh_access_token()
-            else:
-                raise RedEnergyAuthError("Token expired and no refresh token available")
+            # Concurrent usage fetches can all see the same expired token -
+            # the first refreshes it and the rest reuse the new one.
+            async with self._auth_lock:
+                if self._token_expires and datetime.now() >= self._token_expires:
+                    if self._refresh_token:
+                        await self._refresh_access_token()
+                    else:
+                        raise RedEnergyAuthError("Token expired and no refresh token available")
     
     async def _refresh_access_token(self) -> None:
         """Refresh the access token using refresh token."""
@@ -28,6 +28,22 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Daily usage entry fields reported as period totals, all summed together in
+# a single pass over the period's entries.
+_PERIOD_TOTAL_FIELDS = (
+    "import_usage",
+    "export_usage",
+    "peak_import_usage",
+    "offpeak_import_usage",
+    "shoulder_import_usage",
+    "peak_export_usage",
+    "offpeak_export_usage",
+    "shoulder_export_usage",
+    "import_cost",
+    "export_credit",
+    "carbon_emission_tonne",
+)
+
 
 class RedEnergyDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Red Energy data."""
@@ -62,6 +78,12 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         self._properties: list[dict[str, Any]] = []
         # Track last calendar day we refreshed metadata (customer/properties)
         self._last_metadata_refresh_date: date | None = None
+        # Period totals memoized per update, keyed by (property_id,
+        # service_type) - several sensors share each denominator. Tied to
+        # the self.data object it was computed from, so any replacement of
+        # self.data invalidates it.
+        self._totals_cache: dict[tuple[str, str], dict[str, float] | None] = {}
+        self._totals_cache_data: dict[str, Any] | None = None
 
         super().__init__(
             hass,
@@ -71,7 +93,9 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
 
-    def _get_billing_period_start(self, service: dict[str, Any]) -> datetime:
+    def _get_billing_period_start(
+        self, service: dict[str, Any], now: datetime | None = None
+    ) -> datetime:
         """Resolve the current billing period's start date.
 
         lastBillDate is the final day of the *previous* billing period, so
@@ -80,7 +104,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         to a 30-day window when lastBillDate is missing, invalid, in the
         future, or implausibly old (>90 days).
         """
-        end_date = datetime.now()
+        end_date = now or datetime.now()
         start_date = None
 
         last_bill_date = service.get("lastBillDate")
@@ -112,9 +136,12 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
 
         return start_date
 
-    def _get_usage_period_dates(self, service: dict[str, Any]) -> tuple[datetime, datetime]:
-        end_date = datetime.now()
-        start_date = self._get_billing_period_start(service)
+    def _get_usage_period_dates(
+        self, service: dict[str, Any], now: datetime | None = None
+    ) -> tuple[datetime, datetime]:
+        # Both ends share one clock reading so the 30-day fallback is exact
+        end_date = now or datetime.now()
+        start_date = self._get_billing_period_start(service, end_date)
         return start_date, end_date
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -147,6 +174,12 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             matched_properties = 0
             skipped_properties = 0
             
+            # (property_id, service_type, consumer_number, start_date, end_date)
+            # for each service to fetch usage for - fetched concurrently below.
+            fetches: list[tuple[str, str, str, datetime, datetime]] = []
+            # Every service's period ends at the same instant this update
+            now = datetime.now()
+
             for property_data in self._properties:
                 property_id = property_data.get("id")
                 property_name = property_data.get("name", "Unknown")
@@ -170,7 +203,16 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("  Property has %d services: %s", 
                             len(property_services),
                             [s.get("type") for s in property_services])
-                property_usage = {}
+
+                # Always record the property, even if no service returns usage
+                # data (e.g. a BASIC/manual-read gas meter, which never has
+                # interval usage). Its metadata (NMI, balance, bill dates, etc.)
+                # is still valid, so the device and metadata-only sensors must
+                # still be created - only usage-dependent sensors go unavailable.
+                usage_data[property_id_str] = {
+                    "property": property_data,
+                    "services": {},
+                }
                 
                 for service in property_services:
                     service_type = service.get("type")
@@ -194,84 +236,45 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                         continue
                     
                     _LOGGER.debug("    Service %s MATCHED - fetching usage data", service_type)
+
+                    start_date, end_date = self._get_usage_period_dates(service, now)
                     
-                    try:
-                        start_date, end_date = self._get_usage_period_dates(service)
-                        
-                        _LOGGER.debug("    Calling API get_usage_data: consumer=%s, from=%s, to=%s",
-                                    consumer_number, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-                        
-                        raw_usage = await self.api.get_usage_data(
-                            consumer_number, start_date, end_date
-                        )
-                        
-                        _LOGGER.debug("    Raw usage API response type: %s", type(raw_usage))
-                        _LOGGER.debug("    Raw usage API response: %s", raw_usage)
-                        
-                        # Check if API returned an error response
-                        if isinstance(raw_usage, dict) and raw_usage.get("error"):
-                            error_message = raw_usage.get("error_message", "Unknown error")
-                            # BASIC/manual-read gas meters don't have half-hourly
-                            # interval usage - the API returns this as an error
-                            # for every request, which is expected, not a failure.
-                            is_no_interval_usage = "does not have interval usages" in error_message
-                            log_method = _LOGGER.info if is_no_interval_usage else _LOGGER.warning
-                            log_method(
-                                "API returned error for %s service (consumer %s): %s - %s. "
-                                "Skipping this service but continuing with others.",
-                                service_type,
-                                consumer_number,
-                                error_message,
-                                raw_usage.get("error_details", "No details")
-                            )
-                            # Skip this service but continue with others
-                            continue
-                        
-                        # Validate usage data
-                        validated_usage = validate_usage_data(raw_usage)
-                        
-                        period_days = (end_date - start_date).days
-                        
-                        property_usage[service_type] = {
-                            "consumer_number": consumer_number,
-                            "usage_data": validated_usage,
-                            "last_updated": end_date.isoformat(),
-                            "start_date": start_date.isoformat(),
-                            "end_date": end_date.isoformat(),
-                            "period_days": period_days,
-                        }
-                        
-                        _LOGGER.info(
-                            "    Successfully fetched %s usage for property %s: %s total usage, %s total cost",
-                            service_type,
-                            property_id,
-                            validated_usage.get("total_usage", 0),
-                            validated_usage.get("total_cost", 0)
-                        )
-                        
-                    except (RedEnergyAPIError, DataValidationError) as err:
-                        _LOGGER.error(
-                            "    Failed to fetch/validate %s usage for property %s: %s",
-                            service_type,
-                            property_id,
-                            err,
-                            exc_info=True
-                        )
-                        # Don't fail the entire update for one service error
-                        continue
-                
-                # Always record the property, even if no service returned usage
-                # data (e.g. a BASIC/manual-read gas meter, which never has
-                # interval usage). Its metadata (NMI, balance, bill dates, etc.)
-                # is still valid, so the device and metadata-only sensors must
-                # still be created - only usage-dependent sensors go unavailable.
-                usage_data[property_id_str] = {
-                    "property": property_data,
-                    "services": property_usage,
+                    # date() renders as YYYY-MM-DD, and only if the record is emitted
+                    _LOGGER.debug("    Calling API get_usage_data: consumer=%s, from=%s, to=%s",
+                                consumer_number, start_date.date(), end_date.date())
+                    fetches.append((property_id_str, service_type, consumer_number, start_date, end_date))
+                    # Reserve the service's slot now so results land in fetch
+                    # order, whichever response arrives first
+                    usage_data[property_id_str]["services"][service_type] = None
+
+            # Each service's usage is an independent network round trip, so
+            # overlap them, and validate each response as soon as it arrives
+            # rather than waiting for the slowest one.
+            # Any other error ends the update, so cancel the fetches still in
+            # flight rather than leaving them to hit the API for nothing.
+            tasks = [asyncio.create_task(self._fetch_service_usage(fetch)) for fetch in fetches]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    fetch, raw_usage = await next_done
+                    property_id_str, service_type = fetch[0], fetch[1]
+                    usage_data[property_id_str]["services"][service_type] = self._build_service_usage(
+                        fetch, raw_usage
+                    )
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            for property_entry in usage_data.values():
+                # Drop the slots of services whose usage couldn't be fetched
+                property_entry["services"] = {
+                    service_type: service
+                    for service_type, service in property_entry["services"].items()
+                    if service is not None
                 }
-                if property_usage:
+                property_name = property_entry["property"].get("name", "Unknown")
+                if property_entry["services"]:
                     _LOGGER.info("Successfully collected usage data for property '%s' with %d services",
-                                property_name, len(property_usage))
+                                property_name, len(property_entry["services"]))
                 else:
                     _LOGGER.info(
                         "No usage data collected for property '%s' - metadata-only sensors will still be created",
@@ -328,7 +331,12 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
     async def _async_refresh_metadata(self) -> None:
         """Refresh customer and properties metadata and update last refresh date."""
         _LOGGER.info("Refreshing Red Energy metadata (customer and properties)")
-        raw_customer_data = await self.api.get_customer_data()
+        # The customer and properties endpoints are independent, so issue
+        # both requests together rather than paying for two round trips.
+        raw_customer_data, raw_properties = await asyncio.gather(
+            self.api.get_customer_data(),
+            self.api.get_properties(),
+        )
         _LOGGER.debug("=" * 80)
         _LOGGER.debug("RAW CUSTOMER API RESPONSE:")
         _LOGGER.debug("Type: %s", type(raw_customer_data))
@@ -338,7 +346,6 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         _LOGGER.info("Validated customer data - ID: %s, Name: %s", 
                     self._customer_data.get("id"), self._customer_data.get("name"))
 
-        raw_properties = await self.api.get_properties()
         _LOGGER.debug("=" * 80)
         _LOGGER.debug("RAW PROPERTIES API RESPONSE:")
         _LOGGER.debug("Type: %s", type(raw_properties))
@@ -413,11 +420,85 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             )
             raise
     
+    def _build_service_usage(
+        self, fetch: tuple[str, str, str, datetime, datetime], raw_usage: Any
+    ) -> dict[str, Any] | None:
+        """Validate one service's usage response, returning its entry or None to skip it."""
+        property_id_str, service_type, consumer_number, start_date, end_date = fetch
+        try:
+            if isinstance(raw_usage, BaseException):
+                raise raw_usage
+
+            _LOGGER.debug("    Raw usage API response type: %s", type(raw_usage))
+            _LOGGER.debug("    Raw usage API response: %s", raw_usage)
+
+            # Check if API returned an error response
+            if isinstance(raw_usage, dict) and raw_usage.get("error"):
+                error_message = raw_usage.get("error_message", "Unknown error")
+                # BASIC/manual-read gas meters don't have half-hourly
+                # interval usage - the API returns this as an error
+                # for every request, which is expected, not a failure.
+                is_no_interval_usage = "does not have interval usages" in error_message
+                log_method = _LOGGER.info if is_no_interval_usage else _LOGGER.warning
+                log_method(
+                    "API returned error for %s service (consumer %s): %s - %s. "
+                    "Skipping this service but continuing with others.",
+                    service_type,
+                    consumer_number,
+                    error_message,
+                    raw_usage.get("error_details", "No details")
+                )
+                # Skip this service but continue with others
+                return None
+
+            # Validate usage data
+            validated_usage = validate_usage_data(raw_usage)
+
+            _LOGGER.info(
+                "    Successfully fetched %s usage for property %s: %s total usage, %s total cost",
+                service_type,
+                property_id_str,
+                validated_usage.get("total_usage", 0),
+                validated_usage.get("total_cost", 0)
+            )
+
+            return {
+                "consumer_number": consumer_number,
+                "usage_data": validated_usage,
+                "last_updated": end_date.isoformat(),
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "period_days": (end_date - start_date).days,
+                "daily_count": len(validated_usage.get("usage_data", [])),
+            }
+
+        except (RedEnergyAPIError, DataValidationError) as err:
+            _LOGGER.error(
+                "    Failed to fetch/validate %s usage for property %s: %s",
+                service_type,
+                property_id_str,
+                err,
+                exc_info=True
+            )
+            # Don't fail the entire update for one service error
+            return None
+
+    async def _fetch_service_usage(
+        self, fetch: tuple[str, str, str, datetime, datetime]
+    ) -> tuple[tuple[str, str, str, datetime, datetime], Any]:
+        """Fetch one service's usage, returning it (or the exception raised) with its fetch."""
+        _, _, consumer_number, start_date, end_date = fetch
+        try:
+            return fetch, await self.api.get_usage_data(consumer_number, start_date, end_date)
+        except Exception as err:
+            return fetch, err
+
     async def _fetch_property_usage(self, property_data: dict[str, Any]) -> dict[str, Any] | None:
         """Fetch usage data for a single property."""
         property_id = property_data.get("id")
         property_services = property_data.get("services", [])
         property_usage = {}
+        now = datetime.now()
         
         for service in property_services:
             service_type = service.get("type")
@@ -430,7 +511,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                 continue
             
             try:
-                start_date, end_date = self._get_usage_period_dates(service)
+                start_date, end_date = self._get_usage_period_dates(service, now)
                 
                 raw_usage = await self.api.get_usage_data(
                     consumer_number, start_date, end_date
@@ -466,6 +547,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                     "start_date": start_date.isoformat(),
                     "end_date": end_date.isoformat(),
                     "period_days": period_days,
+                    "daily_count": len(validated_usage.get("usage_data", [])),
                 }
                 
             except Exception as err:
@@ -784,61 +866,65 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         entry = self._get_latest_usage_entry(property_id, service_type)
         return entry.get("export_usage", 0.0) if entry else None
 
-    def get_total_import_usage(self, property_id: str, service_type: str) -> float | None:
-        """Get total import usage over period."""
+    def _get_period_totals(self, property_id: str, service_type: str) -> dict[str, float] | None:
+        """Sum every period total field in one pass over the daily usage, once per update."""
+        if self._totals_cache_data is not self.data:
+            self._totals_cache.clear()
+            self._totals_cache_data = self.data
+
+        key = (str(property_id), service_type)
+        if key in self._totals_cache:
+            return self._totals_cache[key]
+
+        totals: dict[str, float] | None
         service_data = self.get_service_usage(property_id, service_type)
         if not service_data or "usage_data" not in service_data:
+            totals = None
+        else:
+            totals = dict.fromkeys(_PERIOD_TOTAL_FIELDS, 0.0)
+            for entry in service_data["usage_data"].get("usage_data", []):
+                for field in _PERIOD_TOTAL_FIELDS:
+                    totals[field] += entry.get(field, 0)
+            # Derived from the totals, so it's computed once per update too
+            total_import = totals["import_usage"]
+            emission = totals["carbon_emission_tonne"]
+            totals["emission_factor_kg_per_kwh"] = (
+                round(emission / total_import * 1000, 3) if total_import and emission else 0.0
+            )
+
+        self._totals_cache[key] = totals
+        return totals
+
+    def _get_cached_total(self, property_id: str, service_type: str, field: str) -> float | None:
+        """Return a daily usage field summed over the period."""
+        totals = self._get_period_totals(property_id, service_type)
+        if totals is None:
             return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        return sum(entry.get("import_usage", 0) for entry in usage_data)
+        return totals.get(field, 0)
+
+    def get_total_import_usage(self, property_id: str, service_type: str) -> float | None:
+        """Get total import usage over period."""
+        return self._get_cached_total(property_id, service_type, "import_usage")
 
     def get_total_export_usage(self, property_id: str, service_type: str) -> float | None:
         """Get total export usage over period."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        return sum(entry.get("export_usage", 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, "export_usage")
 
     def get_period_import_usage(self, property_id: str, service_type: str, period: str) -> float | None:
         """Get total import usage for specific time period (PEAK/OFFPEAK/SHOULDER)."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        field_name = f"{period.lower()}_import_usage"
-        return sum(entry.get(field_name, 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, f"{period.lower()}_import_usage")
 
     def get_period_export_usage(self, property_id: str, service_type: str, period: str) -> float | None:
         """Get total export usage for specific time period (PEAK/OFFPEAK/SHOULDER)."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        field_name = f"{period.lower()}_export_usage"
-        return sum(entry.get(field_name, 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, f"{period.lower()}_export_usage")
 
     def get_total_import_cost(self, property_id: str, service_type: str) -> float | None:
         """Get total import cost over period."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        return sum(entry.get("import_cost", 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, "import_cost")
 
     def get_total_export_credit(self, property_id: str, service_type: str) -> float | None:
         """Get total export credit over period."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        return sum(entry.get("export_credit", 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, "export_credit")
 
     def get_net_total_cost(self, property_id: str, service_type: str) -> float | None:
         """Get net total cost (import - export) over period."""
@@ -884,12 +970,11 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
 
     def get_total_carbon_emission(self, property_id: str, service_type: str) -> float | None:
         """Get total carbon emissions over period."""
-        service_data = self.get_service_usage(property_id, service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-        
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        return sum(entry.get("carbon_emission_tonne", 0) for entry in usage_data)
+        return self._get_cached_total(property_id, service_type, "carbon_emission_tonne")
+
+    def get_emission_factor(self, property_id: str, service_type: str) -> float | None:
+        """Get carbon emissions per kWh of grid import over period, in kg CO2/kWh."""
+        return self._get_cached_total(property_id, service_type, "emission_factor_kg_per_kwh")
 
     def get_latest_import_cost(self, property_id: str, service_type: str) -> float | None:
         """Get the most recent daily import cost."""
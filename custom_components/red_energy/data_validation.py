@@ -383,15 +383,10 @@ def validate_usage_data(data: dict[str, Any]) -> dict[str, Any]:
         raise DataValidationError("usage_data must be a list")
     
     validated_entries = []
-    total_usage = 0.0
-    total_cost = 0.0
     
     for entry in usage_entries:
         try:
-            validated_entry = validate_usage_entry(entry)
-            validated_entries.append(validated_entry)
-            total_usage += validated_entry["usage"]
-            total_cost += validated_entry["cost"]
+            validated_entries.append(validate_usage_entry(entry))
         except DataValidationError as err:
             _LOGGER.warning("Usage entry validation failed: %s", err)
             continue
@@ -401,8 +396,8 @@ def validate_usage_data(data: dict[str, Any]) -> dict[str, Any]:
         "from_date": data.get("from_date", ""),
         "to_date": data.get("to_date", ""),
         "usage_data": validated_entries,
-        "total_usage": round(total_usage, 2),
-        "total_cost": round(total_cost, 2),
+        "total_usage": round(sum(entry["usage"] for entry in validated_entries), 2),
+        "total_cost": round(sum(entry["cost"] for entry in validated_entries), 2),
     }
 
 
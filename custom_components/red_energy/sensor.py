@@ -1,9 +1,12 @@
 """Red Energy sensor platform."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import logging
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,8 +14,8 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, UnitOfEnergy
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, UnitOfEnergy, UnitOfPower
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -61,6 +64,51 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks a per-update cache slot as not yet resolved - None can't be used since
+# it's a legitimate resolved value (e.g. no usage data for the service).
+_UNRESOLVED: Final = object()
+
+_ENERGY_UNIT: Final = {
+    SERVICE_TYPE_ELECTRICITY: UnitOfEnergy.KILO_WATT_HOUR,
+    SERVICE_TYPE_GAS: "MJ",
+}
+
+# Descriptions reported in the sensors' description attribute.
+_DESC_PEAK_USAGE: Final = (
+    "Day with the highest net (import - export) grid usage in the period, "
+    "not a TOU peak-period or demand figure"
+)
+_DESC_CARBON_EMISSION: Final = "Total carbon emissions from grid consumption"
+_DESC_CL2_ENERGY: Final = "Inferred controlled-load energy, algebraically separated from blended TOU+CL2 interval data"
+_DESC_CORRECTED_PEAK_IMPORT: Final = "Peak-period grid import with inferred CL2 energy excluded"
+_DESC_CORRECTED_SHOULDER_IMPORT: Final = "Shoulder-period grid import with inferred CL2 energy excluded"
+_DESC_CORRECTED_OFFPEAK_IMPORT: Final = "Off-peak-period grid import with inferred CL2 energy excluded"
+_DESC_CL2_COST: Final = "Inferred cost of controlled-load energy within the blended interval cost"
+_DESC_RECONSTRUCTED_IMPORT_COST: Final = (
+    "Import cost reconstructed from inferred TOU and CL2 components, "
+    "for comparison against the API's own daily cost"
+)
+
+# Display form of the billing frequencies the API reports; anything else
+# falls back to title case.
+_BILLING_FREQ_DISPLAY: Final = {
+    "MONTHLY": "Monthly",
+    "QUARTERLY": "Quarterly",
+    "WEEKLY": "Weekly",
+    "FORTNIGHTLY": "Fortnightly",
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, cached since the API repeats them across polls."""
+    return datetime.fromisoformat(value)
+
+
+def _format_display_name(sensor_type: str) -> str:
+    """Turn a sensor_type key like "daily_import_usage" into "Daily Import Usage"."""
+    return sensor_type.replace('_', ' ').title()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -118,20 +166,16 @@ async def async_setup_entry(
                 RedEnergyStatusSensor(coordinator, config_entry, account_id, service_type),
                 RedEnergyAddressSensor(coordinator, config_entry, account_id, service_type),
                 RedEnergyPaymentTypeSensor(coordinator, config_entry, account_id, service_type),
-                # Daily import/export usage breakdown
-                RedEnergyDailyImportUsageSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyDailyExportUsageSensor(coordinator, config_entry, account_id, service_type),
-                # Total import/export usage breakdown
-                RedEnergyTotalImportUsageSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyTotalExportUsageSensor(coordinator, config_entry, account_id, service_type),
-                # Daily cost/credit breakdown
-                RedEnergyDailyImportCostSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyDailyExportCreditSensor(coordinator, config_entry, account_id, service_type),
-                # Total cost/credit breakdown
-                RedEnergyTotalImportCostSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyTotalExportCreditSensor(coordinator, config_entry, account_id, service_type),
             ]
 
+            # Import/export usage, cost/credit, and time-of-use breakdown
+            # sensors, all one class configured by their MetricSpec.
+            service_entities.extend(
+                RedEnergyMetricSensor(coordinator, config_entry, account_id, service_type, spec)
+                for spec in METRIC_SPECS
+                if spec.applies_to(service_type) and (advanced_sensors_enabled or not spec.advanced)
+            )
+
             # One diagnostic sensor per contracted tariff rate (peak/off-peak/
             # supply/demand/etc.) - a dynamic, variable-count set driven by
             # the plan's actual rates rather than a fixed sensor list.
@@ -148,14 +192,6 @@ async def async_setup_entry(
                     RedEnergyMonthlyAverageSensor(coordinator, config_entry, account_id, service_type),
                     RedEnergyPeakUsageSensor(coordinator, config_entry, account_id, service_type),
                     RedEnergyEfficiencySensor(coordinator, config_entry, account_id, service_type),
-                    # NEW: Time period import breakdown (ADVANCED)
-                    RedEnergyPeakImportUsageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyOffpeakImportUsageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyShoulderImportUsageSensor(coordinator, config_entry, account_id, service_type),
-                    # NEW: Time period export breakdown (ADVANCED)
-                    RedEnergyPeakExportUsageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyOffpeakExportUsageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyShoulderExportUsageSensor(coordinator, config_entry, account_id, service_type),
                     # NEW: Demand and environmental (ADVANCED)
                     RedEnergyMaxDemandSensor(coordinator, config_entry, account_id, service_type),
                     RedEnergyMaxDemandTimeSensor(coordinator, config_entry, account_id, service_type),
@@ -239,6 +275,18 @@ async def async_setup_entry(
 class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Red Energy sensors."""
 
+    # HA's Entity base classes still provide a __dict__ (for _attr_* and
+    # cached properties), but the per-sensor fields read on every state
+    # write live in slots.
+    __slots__ = (
+        "_config_entry",
+        "_property_id",
+        "_service_type",
+        "_sensor_type",
+        "_service_ref",
+        "_cached_attrs",
+    )
+
     # Whether this sensor needs interval usage data to report a value.
     # BASIC/manual-read meters never have interval usage, so these sensors
     # are disabled by default for such accounts (see async_setup_entry).
@@ -252,6 +300,11 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
     # Not created at all for gas accounts (see async_setup_entry).
     _electricity_only: bool = False
 
+    # Whether this sensor reports an energy quantity. Its device class and
+    # unit are then set from _ENERGY_UNIT for the service type - kWh for
+    # electricity, MJ for gas.
+    _reports_energy: bool = False
+
     def __init__(
         self,
         coordinator: RedEnergyDataCoordinator,
@@ -267,13 +320,23 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
         self._property_id = property_id
         self._service_type = service_type
         self._sensor_type = sensor_type
+        # This sensor's coordinator service usage dict, resolved once per
+        # coordinator update rather than on every state/attribute read.
+        self._service_ref: Any = _UNRESOLVED
+        # Extra state attributes, built on first read and then once per
+        # coordinator update rather than on every state read.
+        self._cached_attrs: Any = _UNRESOLVED
 
         # No account_id/service prefix here - the device (named "{account_id}
         # - {Service}", see device_manager.py) already conveys both, and HA
         # shows device name + entity name together in the UI.
-        self._attr_name = sensor_type.replace('_', ' ').title()
+        self._attr_name = _format_display_name(sensor_type)
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{property_id}_{service_type}_{sensor_type}"
         
+        if self._reports_energy and service_type in _ENERGY_UNIT:
+            self._attr_device_class = SensorDeviceClass.ENERGY
+            self._attr_native_unit_of_measurement = _ENERGY_UNIT[service_type]
+
         # Set device info for grouping (device_manager handles full device metadata)
         self._attr_device_info = {
             "identifiers": {(DOMAIN, property_id)},
@@ -302,8 +365,42 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
                      self._attr_unique_id, property_id_str)
         return True
 
+    @property
+    def _service_data(self) -> dict[str, Any] | None:
+        """Return the service usage dict for this sensor's property and service."""
+        if self._service_ref is _UNRESOLVED:
+            self._service_ref = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        return self._service_ref
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-resolve the cached service usage reference before writing state."""
+        self._service_ref = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Refresh state derived from the coordinator's current data.
+
+        Attributes only change when the coordinator updates, so they're built
+        once here rather than on every state read. Sensors that publish their
+        value the same way extend this.
+        """
+        self._cached_attrs = self._build_attributes()
+
+    def _build_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes for the current coordinator data."""
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes."""
+        if self._cached_attrs is _UNRESOLVED:
+            self._cached_attrs = self._build_attributes()
+        return self._cached_attrs
+
     def _get_period_description(self) -> str:
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data:
             return "30 days"
 
@@ -365,10 +462,9 @@ class RedEnergyCostSensor(RedEnergyBaseSensor):
         """Return the total cost."""
         return self.coordinator.get_total_cost(self._property_id, self._service_type)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data:
             return None
         
@@ -383,6 +479,8 @@ class RedEnergyCostSensor(RedEnergyBaseSensor):
 class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
     """Red Energy daily average usage sensor."""
 
+    _reports_energy = True
+
     def __init__(
         self,
         coordinator: RedEnergyDataCoordinator,
@@ -392,21 +490,13 @@ class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
     ) -> None:
         """Initialize the daily average sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_DAILY_AVERAGE)
-        
-        # Set appropriate device class and unit
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-            
+
         self._attr_state_class = None
 
     @property
     def native_value(self) -> float | None:
         """Return the daily average usage."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data or "usage_data" not in service_data:
             return None
         
@@ -418,10 +508,9 @@ class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
         total_usage = sum(entry.get("usage", 0) for entry in usage_data)
         return round(total_usage / len(usage_data), 2) if usage_data else 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data:
             return None
         
@@ -436,6 +525,8 @@ class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
 class RedEnergyMonthlyAverageSensor(RedEnergyBaseSensor):
     """Red Energy monthly average usage sensor."""
 
+    _reports_energy = True
+
     def __init__(
         self,
         coordinator: RedEnergyDataCoordinator,
@@ -446,13 +537,6 @@ class RedEnergyMonthlyAverageSensor(RedEnergyBaseSensor):
         """Initialize the monthly average sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_MONTHLY_AVERAGE)
         
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-            
         self._attr_state_class = None
 
     @property
@@ -462,7 +546,7 @@ class RedEnergyMonthlyAverageSensor(RedEnergyBaseSensor):
         if total_usage is None:
             return None
         
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data:
             return None
         
@@ -483,6 +567,8 @@ class RedEnergyPeakUsageSensor(RedEnergyBaseSensor):
     usage across the returned period.
     """
 
+    _reports_energy = True
+
     def __init__(
         self,
         coordinator: RedEnergyDataCoordinator,
@@ -494,19 +580,12 @@ class RedEnergyPeakUsageSensor(RedEnergyBaseSensor):
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_PEAK_USAGE)
         self._attr_name = "Highest Net Usage Day"
 
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-            
         self._attr_state_class = None
 
     @property
     def native_value(self) -> float | None:
         """Return the highest daily net usage (import - export)."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data or "usage_data" not in service_data:
             return None
 
@@ -518,10 +597,9 @@ class RedEnergyPeakUsageSensor(RedEnergyBaseSensor):
         usage_values = [entry.get("usage", 0) for entry in usage_data]
         return max(usage_values) if usage_values else 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data or "usage_data" not in service_data:
             return None
 
@@ -534,7 +612,7 @@ class RedEnergyPeakUsageSensor(RedEnergyBaseSensor):
 
         return {
             "consumer_number": service_data.get("consumer_number"),
-            "description": "Day with the highest net (import - export) grid usage in the period, not a TOU peak-period or demand figure",
+            "description": _DESC_PEAK_USAGE,
             "peak_date": peak_entry.get("date"),
             "peak_cost": peak_entry.get("cost"),
             "service_type": self._service_type,
@@ -563,7 +641,7 @@ class RedEnergyEfficiencySensor(RedEnergyBaseSensor):
     @property
     def native_value(self) -> float | None:
         """Return the efficiency rating (0-100%)."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data or "usage_data" not in service_data:
             return None
         
@@ -590,10 +668,9 @@ class RedEnergyEfficiencySensor(RedEnergyBaseSensor):
         efficiency = max(0, min(100, 100 - (cv * 100)))
         return round(efficiency, 1)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        service_data = self._service_data
         if not service_data or "usage_data" not in service_data:
             return None
         
@@ -603,12 +680,13 @@ class RedEnergyEfficiencySensor(RedEnergyBaseSensor):
         
         usage_values = [entry.get("usage", 0) for entry in usage_data]
         mean_usage = sum(usage_values) / len(usage_values) if usage_values else 0
+        efficiency = self.native_value
         
         return {
             "consumer_number": service_data.get("consumer_number"),
             "mean_daily_usage": round(mean_usage, 2),
-            "usage_variation": "Low" if self.native_value and self.native_value > 80 else 
-                             "Medium" if self.native_value and self.native_value > 60 else "High",
+            "usage_variation": "Low" if efficiency and efficiency > 80 else
+                             "Medium" if efficiency and efficiency > 60 else "High",
             "calculation_days": len(usage_data),
             "service_type": self._service_type,
         }
@@ -727,8 +805,7 @@ class RedEnergyProductNameSensor(RedEnergyBaseSensor):
 
         return metadata.get("productName")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
         metadata = self.coordinator.get_service_metadata(self._property_id, self._service_type)
         if not metadata:
@@ -806,6 +883,8 @@ class RedEnergyRateSensor(RedEnergyBaseSensor):
     both the unique_id and the coordinator lookup.
     """
 
+    __slots__ = ("_rate_code", "_rate_desc")
+
     _requires_usage_data = False
 
     def __init__(
@@ -861,8 +940,7 @@ class RedEnergyRateSensor(RedEnergyBaseSensor):
         rate = self._find_rate()
         return rate.get("rate_incl_gst_dollars") if rate else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return the remaining rate fields as attributes."""
         rate = self._find_rate()
         if not rate:
@@ -911,8 +989,7 @@ class RedEnergyBillingPeriodServiceChargeSensor(RedEnergyBaseSensor):
         """Return the accumulated billing period service charge, GST-inclusive."""
         return self.coordinator.get_billing_period_service_charge(self._property_id, self._service_type)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return the rate basis, day count, and calculation for the billing period service charge."""
         if self.native_value is None:
             return None
@@ -979,8 +1056,7 @@ class RedEnergyAddressSensor(RedEnergyBaseSensor):
             return f"{formatted} {state_postcode}"
         return formatted or state_postcode or None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return latitude/longitude so the address can be plotted on a map."""
         metadata = self.coordinator.get_service_metadata(self._property_id, self._service_type)
         if not metadata:
@@ -1155,7 +1231,7 @@ class RedEnergyBillingFrequencySensor(RedEnergyBaseSensor):
         
         frequency = metadata.get("billingFrequency")
         if frequency:
-            return frequency.title()
+            return _BILLING_FREQ_DISPLAY.get(frequency.upper()) or frequency.title()
         return None
 
 
@@ -1261,354 +1337,148 @@ class RedEnergyStatusSensor(RedEnergyBaseSensor):
         return None
 
 
-class RedEnergyDailyImportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy daily import usage sensor (grid consumption)."""
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the daily import usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "daily_import_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the start of the represented usageDate so HA statistics don't sum across days."""
-        return self._get_latest_usage_date_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current daily import usage."""
-        return self.coordinator.get_latest_import_usage(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "usage_date": self.coordinator.get_latest_usage_date(self._property_id, self._service_type),
-            "service_type": self._service_type,
-            "description": "Grid import (consumption)"
-        }
-
-
-class RedEnergyDailyExportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy daily export usage sensor (solar generation)."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the daily export usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "daily_export_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-            self._attr_icon = "mdi:solar-power"
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the start of the represented usageDate so HA statistics don't sum across days."""
-        return self._get_latest_usage_date_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current daily export usage."""
-        return self.coordinator.get_latest_export_usage(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "usage_date": self.coordinator.get_latest_usage_date(self._property_id, self._service_type),
-            "service_type": self._service_type,
-            "description": "Solar export (generation)"
-        }
-
-
-class RedEnergyTotalImportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy total import usage sensor (30-day period)."""
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the total import usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "total_import_usage")
-
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-
-        self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the billing period start date so HA statistics reset correctly."""
-        return self._get_last_bill_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the total import usage."""
-        return self.coordinator.get_total_import_usage(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        usage_data = service_data.get("usage_data", {})
-        daily_data = usage_data.get("usage_data", [])
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "service_type": self._service_type,
-            "period": self._get_period_description(),
-            "daily_count": len(daily_data),
-            "from_date": usage_data.get("from_date"),
-            "to_date": usage_data.get("to_date"),
-            "description": "Total grid import"
-        }
-
-
-class RedEnergyTotalExportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy total export usage sensor (30-day period)."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the total export usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "total_export_usage")
-
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_icon = "mdi:solar-power"
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-
-        self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the billing period start date so HA statistics reset correctly."""
-        return self._get_last_bill_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the total export usage."""
-        return self.coordinator.get_total_export_usage(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        usage_data = service_data.get("usage_data", {})
-        daily_data = usage_data.get("usage_data", [])
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "service_type": self._service_type,
-            "period": self._get_period_description(),
-            "daily_count": len(daily_data),
-            "from_date": usage_data.get("from_date"),
-            "to_date": usage_data.get("to_date"),
-            "description": "Total solar export"
-        }
-
-
-class RedEnergyTotalImportCostSensor(RedEnergyBaseSensor):
-    """Red Energy total import cost sensor."""
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the total import cost sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "total_import_cost")
-
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_native_unit_of_measurement = "AUD"
-        self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the billing period start date so HA statistics reset correctly."""
-        return self._get_last_bill_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the total import cost."""
-        return self.coordinator.get_total_import_cost(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "service_type": self._service_type,
-            "period": self._get_period_description(),
-            "gst_inclusive": False,
-            "description": "Total cost of grid import"
-        }
-
-
-class RedEnergyTotalExportCreditSensor(RedEnergyBaseSensor):
-    """Red Energy total export credit sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the total export credit sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "total_export_credit")
-
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_native_unit_of_measurement = "AUD"
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:solar-power"
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the billing period start date so HA statistics reset correctly."""
-        return self._get_last_bill_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the total export credit."""
-        return self.coordinator.get_total_export_credit(self._property_id, self._service_type)
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    """Describes one import/export usage, cost, or credit sensor.
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "service_type": self._service_type,
-            "period": self._get_period_description(),
-            "description": "Total credit from solar export"
-        }
+    These sensors differ only in which coordinator getter they read and how
+    they're presented, so they share RedEnergyMetricSensor rather than each
+    having its own class.
+    """
 
+    key: str
+    # Coordinator method returning the value, called as
+    # getter(property_id, service_type, *getter_args).
+    getter: str
+    getter_args: tuple[str, ...] = ()
+    description: str | None = None
+    # True for kWh/MJ energy sensors, False for AUD cost/credit sensors.
+    reports_energy: bool = True
+    electricity_only: bool = False
+    icon: str | None = None
+    # "usage_date" for daily sensors, "bill" for billing-period totals, None
+    # for sensors that don't report a last_reset.
+    reset: str | None = None
+    # Time-of-use breakdown sensors: the tariff period reported in the
+    # attributes, and the coordinator getter for the total they're a share of.
+    time_period: str | None = None
+    percentage_of: str | None = None
+    gst_inclusive: bool | None = None
+    # Whether to report the day count and date range of the usage data.
+    period_range: bool = False
+    # Only created when advanced sensors are enabled.
+    advanced: bool = False
+
+    def applies_to(self, service_type: str) -> bool:
+        """Return whether this metric is meaningful for the service type."""
+        return not self.electricity_only or service_type == SERVICE_TYPE_ELECTRICITY
+
+
+METRIC_SPECS: Final[tuple[MetricSpec, ...]] = (
+    MetricSpec(
+        "daily_import_usage", "get_latest_import_usage",
+        description="Grid import (consumption)", reset="usage_date",
+    ),
+    MetricSpec(
+        "daily_export_usage", "get_latest_export_usage",
+        description="Solar export (generation)", electricity_only=True,
+        icon="mdi:solar-power", reset="usage_date",
+    ),
+    MetricSpec(
+        "total_import_usage", "get_total_import_usage",
+        description="Total grid import", reset="bill", period_range=True,
+    ),
+    MetricSpec(
+        "total_export_usage", "get_total_export_usage",
+        description="Total solar export", electricity_only=True,
+        icon="mdi:solar-power", reset="bill", period_range=True,
+    ),
+    MetricSpec(
+        "daily_import_cost", "get_latest_import_cost",
+        description="Cost of grid import for latest day", reports_energy=False,
+        reset="usage_date", gst_inclusive=False,
+    ),
+    MetricSpec(
+        "daily_export_credit", "get_latest_export_credit",
+        description="Credit from solar export for latest day", reports_energy=False,
+        electricity_only=True, icon="mdi:solar-power", reset="usage_date",
+    ),
+    MetricSpec(
+        "total_import_cost", "get_total_import_cost",
+        description="Total cost of grid import", reports_energy=False,
+        reset="bill", gst_inclusive=False,
+    ),
+    MetricSpec(
+        "total_export_credit", "get_total_export_credit",
+        description="Total credit from solar export", reports_energy=False,
+        electricity_only=True, icon="mdi:solar-power", reset="bill",
+    ),
+    MetricSpec(
+        "peak_import_usage", "get_period_import_usage", ("peak",),
+        advanced=True,
+        electricity_only=True, time_period="PEAK",
+        percentage_of="get_total_import_usage",
+    ),
+    MetricSpec(
+        "offpeak_import_usage", "get_period_import_usage", ("offpeak",),
+        advanced=True,
+        electricity_only=True, time_period="OFFPEAK",
+        percentage_of="get_total_import_usage",
+    ),
+    MetricSpec(
+        "shoulder_import_usage", "get_period_import_usage", ("shoulder",),
+        advanced=True,
+        electricity_only=True, time_period="SHOULDER",
+        percentage_of="get_total_import_usage",
+    ),
+    MetricSpec(
+        "peak_export_usage", "get_period_export_usage", ("peak",),
+        advanced=True,
+        description="Solar export during peak tariff", electricity_only=True,
+        icon="mdi:solar-power", time_period="PEAK",
+        percentage_of="get_total_export_usage",
+    ),
+    MetricSpec(
+        "offpeak_export_usage", "get_period_export_usage", ("offpeak",),
+        advanced=True,
+        description="Solar export during offpeak tariff", electricity_only=True,
+        icon="mdi:solar-power", time_period="OFFPEAK",
+        percentage_of="get_total_export_usage",
+    ),
+    MetricSpec(
+        "shoulder_export_usage", "get_period_export_usage", ("shoulder",),
+        advanced=True,
+        description="Solar export during shoulder tariff", electricity_only=True,
+        icon="mdi:solar-power", time_period="SHOULDER",
+        percentage_of="get_total_export_usage",
+    ),
+)
 
-class RedEnergyDailyImportCostSensor(RedEnergyBaseSensor):
-    """Red Energy daily import cost sensor."""
+# Lookup of metric specs by sensor key.
+METRIC_SPEC_BY_KEY: Final = {spec.key: spec for spec in METRIC_SPECS}
 
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the daily import cost sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "daily_import_cost")
-        
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_native_unit_of_measurement = "AUD"
-        self._attr_state_class = SensorStateClass.TOTAL
 
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the start of the represented usageDate so HA statistics don't sum across days."""
-        return self._get_latest_usage_date_reset()
+def _static_attributes(spec: MetricSpec) -> MappingProxyType[str, Any]:
+    """Return the attributes of a metric sensor that never change between updates."""
+    attributes: dict[str, Any] = {}
+    if spec.time_period is not None:
+        attributes["time_period"] = spec.time_period
+    if spec.gst_inclusive is not None:
+        attributes["gst_inclusive"] = spec.gst_inclusive
+    if spec.description is not None:
+        attributes["description"] = spec.description
+    return MappingProxyType(attributes)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current daily import cost."""
-        return self.coordinator.get_latest_import_cost(self._property_id, self._service_type)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "usage_date": self.coordinator.get_latest_usage_date(self._property_id, self._service_type),
-            "service_type": self._service_type,
-            "gst_inclusive": False,
-            "description": "Cost of grid import for latest day"
-        }
+# Constant attributes per metric, shared by every property/service instance
+# and copied into the attributes published on each update.
+_METRIC_ATTR_BASE: Final = {spec.key: _static_attributes(spec) for spec in METRIC_SPECS}
 
 
-class RedEnergyDailyExportCreditSensor(RedEnergyBaseSensor):
-    """Red Energy daily export credit sensor."""
+class RedEnergyMetricSensor(RedEnergyBaseSensor):
+    """Red Energy import/export usage, cost, or credit sensor driven by a MetricSpec."""
 
-    _electricity_only = True
+    __slots__ = ("_spec", "_electricity_only", "_reports_energy")
 
     def __init__(
         self,
@@ -1616,303 +1486,68 @@ class RedEnergyDailyExportCreditSensor(RedEnergyBaseSensor):
         config_entry: ConfigEntry,
         property_id: str,
         service_type: str,
+        spec: MetricSpec,
     ) -> None:
-        """Initialize the daily export credit sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "daily_export_credit")
-        
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_native_unit_of_measurement = "AUD"
+        """Initialize the metric sensor."""
+        # Set before super().__init__(), which reads _reports_energy.
+        self._spec = spec
+        self._electricity_only = spec.electricity_only
+        self._reports_energy = spec.reports_energy
+        super().__init__(coordinator, config_entry, property_id, service_type, spec.key)
+
+        if not spec.reports_energy:
+            self._attr_device_class = SensorDeviceClass.MONETARY
+            self._attr_native_unit_of_measurement = "AUD"
         self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:solar-power"
-
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the start of the represented usageDate so HA statistics don't sum across days."""
-        return self._get_latest_usage_date_reset()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current daily export credit."""
-        return self.coordinator.get_latest_export_credit(self._property_id, self._service_type)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "last_updated": service_data.get("last_updated"),
-            "usage_date": self.coordinator.get_latest_usage_date(self._property_id, self._service_type),
-            "service_type": self._service_type,
-            "description": "Credit from solar export for latest day"
-        }
+        if spec.icon:
+            self._attr_icon = spec.icon
 
+        self._update_from_coordinator()
 
-class RedEnergyPeakImportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy peak import usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the peak import usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "peak_import_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the peak import usage."""
-        return self.coordinator.get_period_import_usage(self._property_id, self._service_type, "peak")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        total_import = self.coordinator.get_total_import_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_import * 100) if total_import and self.native_value else 0
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "time_period": "PEAK",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description()
-        }
-
-
-class RedEnergyOffpeakImportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy offpeak import usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the offpeak import usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "offpeak_import_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the offpeak import usage."""
-        return self.coordinator.get_period_import_usage(self._property_id, self._service_type, "offpeak")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        total_import = self.coordinator.get_total_import_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_import * 100) if total_import and self.native_value else 0
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "time_period": "OFFPEAK",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description()
-        }
-
-
-class RedEnergyShoulderImportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy shoulder import usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the shoulder import usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "shoulder_import_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the shoulder import usage."""
-        return self.coordinator.get_period_import_usage(self._property_id, self._service_type, "shoulder")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+    def _update_from_coordinator(self) -> None:
+        """Publish the metric value, last_reset, and attributes."""
+        spec = self._spec
+        self._attr_native_value = getattr(self.coordinator, spec.getter)(
+            self._property_id, self._service_type, *spec.getter_args
+        )
+        if spec.reset == "usage_date":
+            self._attr_last_reset = self._get_latest_usage_date_reset()
+        elif spec.reset == "bill":
+            self._attr_last_reset = self._get_last_bill_reset()
+        super()._update_from_coordinator()
+
+    def _build_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes for the current coordinator data."""
+        service_data = self._service_data
         if not service_data:
             return None
-        
-        total_import = self.coordinator.get_total_import_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_import * 100) if total_import and self.native_value else 0
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "time_period": "SHOULDER",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description()
-        }
-
-
-class RedEnergyPeakExportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy peak export usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the peak export usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "peak_export_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-            self._attr_icon = "mdi:solar-power"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the peak export usage."""
-        return self.coordinator.get_period_export_usage(self._property_id, self._service_type, "peak")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        total_export = self.coordinator.get_total_export_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_export * 100) if total_export and self.native_value else 0
-        
-        return {
+        spec = self._spec
+        attributes: dict[str, Any] = {
+            **_METRIC_ATTR_BASE[spec.key],
             "consumer_number": service_data.get("consumer_number"),
-            "time_period": "PEAK",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description(),
-            "description": "Solar export during peak tariff"
         }
 
-
-class RedEnergyOffpeakExportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy offpeak export usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the offpeak export usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "offpeak_export_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-            self._attr_icon = "mdi:solar-power"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the offpeak export usage."""
-        return self.coordinator.get_period_export_usage(self._property_id, self._service_type, "offpeak")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        total_export = self.coordinator.get_total_export_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_export * 100) if total_export and self.native_value else 0
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "time_period": "OFFPEAK",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description(),
-            "description": "Solar export during offpeak tariff"
-        }
-
-
-class RedEnergyShoulderExportUsageSensor(RedEnergyBaseSensor):
-    """Red Energy shoulder export usage sensor."""
-
-    _electricity_only = True
-
-    def __init__(
-        self,
-        coordinator: RedEnergyDataCoordinator,
-        config_entry: ConfigEntry,
-        property_id: str,
-        service_type: str,
-    ) -> None:
-        """Initialize the shoulder export usage sensor."""
-        super().__init__(coordinator, config_entry, property_id, service_type, "shoulder_export_usage")
-        
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL
-            self._attr_icon = "mdi:solar-power"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the shoulder export usage."""
-        return self.coordinator.get_period_export_usage(self._property_id, self._service_type, "shoulder")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data:
-            return None
-        
-        total_export = self.coordinator.get_total_export_usage(self._property_id, self._service_type)
-        percentage = (self.native_value / total_export * 100) if total_export and self.native_value else 0
-        
-        return {
-            "consumer_number": service_data.get("consumer_number"),
-            "time_period": "SHOULDER",
-            "percentage_of_total": round(percentage, 1),
-            "period": self._get_period_description(),
-            "description": "Solar export during shoulder tariff"
-        }
+        if spec.time_period is not None:
+            total = getattr(self.coordinator, spec.percentage_of)(self._property_id, self._service_type)
+            native = self._attr_native_value
+            attributes["percentage_of_total"] = round(native / total * 100, 1) if (native and total) else 0.0
+            attributes["period"] = self._get_period_description()
+        else:
+            attributes["last_updated"] = service_data.get("last_updated")
+            if spec.reset == "usage_date":
+                attributes["usage_date"] = self.coordinator.get_latest_usage_date(
+                    self._property_id, self._service_type
+                )
+            attributes["service_type"] = self._service_type
+            if spec.reset == "bill":
+                attributes["period"] = self._get_period_description()
+            if spec.period_range:
+                attributes["daily_count"] = service_data.get("daily_count", 0)
+                usage_data = service_data.get("usage_data", {})
+                attributes["from_date"] = usage_data.get("from_date")
+                attributes["to_date"] = usage_data.get("to_date")
+        return attributes
 
 
 class RedEnergyMaxDemandSensor(RedEnergyBaseSensor):
@@ -1929,9 +1564,7 @@ class RedEnergyMaxDemandSensor(RedEnergyBaseSensor):
     ) -> None:
         """Initialize the maximum demand sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, "max_demand")
-        
-        from homeassistant.const import UnitOfPower
-        
+
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -1943,8 +1576,7 @@ class RedEnergyMaxDemandSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_max_demand_data(self._property_id, self._service_type)
         return data.get("max_demand_kw") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
         data = self.coordinator.get_max_demand_data(self._property_id, self._service_type)
         if not data:
@@ -1987,7 +1619,7 @@ class RedEnergyMaxDemandTimeSensor(RedEnergyBaseSensor):
             return None
         
         try:
-            return datetime.fromisoformat(data["max_demand_time"])
+            return _parse_iso(data["max_demand_time"])
         except (ValueError, TypeError):
             return None
 
@@ -2016,18 +1648,14 @@ class RedEnergyCarbonEmissionSensor(RedEnergyBaseSensor):
         """Return the total carbon emissions."""
         return self.coordinator.get_total_carbon_emission(self._property_id, self._service_type)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        total_import = self.coordinator.get_total_import_usage(self._property_id, self._service_type)
-        emission = self.native_value
-        
-        emission_factor = (emission / total_import * 1000) if total_import and emission else 0
-        
+        emission_factor = self.coordinator.get_emission_factor(self._property_id, self._service_type)
+
         return {
-            "emission_factor_kg_per_kwh": round(emission_factor, 3),
+            "emission_factor_kg_per_kwh": emission_factor or 0.0,
             "period": self._get_period_description(),
-            "description": "Total carbon emissions from grid consumption"
+            "description": _DESC_CARBON_EMISSION
         }
 
 
@@ -2068,8 +1696,7 @@ class RedEnergyCl2EnergySensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("cl2_energy_kwh") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing inference quality."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2081,7 +1708,7 @@ class RedEnergyCl2EnergySensor(RedEnergyBaseSensor):
             "rejection_reasons": data.get("rejection_reasons"),
             "rates_used": data.get("rates_used"),
             "rates_source": data.get("rates_source"),
-            "description": "Inferred controlled-load energy, algebraically separated from blended TOU+CL2 interval data",
+            "description": _DESC_CL2_ENERGY,
         }
 
 
@@ -2115,8 +1742,7 @@ class RedEnergyCorrectedPeakImportSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("corrected_peak_kwh") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing inference quality."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2126,7 +1752,7 @@ class RedEnergyCorrectedPeakImportSensor(RedEnergyBaseSensor):
             "accepted_interval_count": data.get("accepted_interval_count"),
             "rejected_interval_count": data.get("rejected_interval_count"),
             "rates_source": data.get("rates_source"),
-            "description": "Peak-period grid import with inferred CL2 energy excluded",
+            "description": _DESC_CORRECTED_PEAK_IMPORT,
         }
 
 
@@ -2160,8 +1786,7 @@ class RedEnergyCorrectedShoulderImportSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("corrected_shoulder_kwh") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing inference quality."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2171,7 +1796,7 @@ class RedEnergyCorrectedShoulderImportSensor(RedEnergyBaseSensor):
             "accepted_interval_count": data.get("accepted_interval_count"),
             "rejected_interval_count": data.get("rejected_interval_count"),
             "rates_source": data.get("rates_source"),
-            "description": "Shoulder-period grid import with inferred CL2 energy excluded",
+            "description": _DESC_CORRECTED_SHOULDER_IMPORT,
         }
 
 
@@ -2205,8 +1830,7 @@ class RedEnergyCorrectedOffpeakImportSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("corrected_offpeak_kwh") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing inference quality."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2216,7 +1840,7 @@ class RedEnergyCorrectedOffpeakImportSensor(RedEnergyBaseSensor):
             "accepted_interval_count": data.get("accepted_interval_count"),
             "rejected_interval_count": data.get("rejected_interval_count"),
             "rates_source": data.get("rates_source"),
-            "description": "Off-peak-period grid import with inferred CL2 energy excluded",
+            "description": _DESC_CORRECTED_OFFPEAK_IMPORT,
         }
 
 
@@ -2251,8 +1875,7 @@ class RedEnergyCl2CostSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("cl2_cost") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing inference quality."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2262,7 +1885,7 @@ class RedEnergyCl2CostSensor(RedEnergyBaseSensor):
             "gst_inclusive": True,
             "rates_used": data.get("rates_used"),
             "rates_source": data.get("rates_source"),
-            "description": "Inferred cost of controlled-load energy within the blended interval cost",
+            "description": _DESC_CL2_COST,
         }
 
 
@@ -2296,8 +1919,7 @@ class RedEnergyReconstructedImportCostSensor(RedEnergyBaseSensor):
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         return data.get("reconstructed_import_cost") if data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_attributes(self) -> dict[str, Any] | None:
         """Return diagnostic attributes describing reconciliation against the API's own cost."""
         data = self.coordinator.get_cl2_inference(self._property_id, self._service_type)
         if not data:
@@ -2310,5 +1932,5 @@ class RedEnergyReconstructedImportCostSensor(RedEnergyBaseSensor):
             "accepted_interval_count": data.get("accepted_interval_count"),
             "rejected_interval_count": data.get("rejected_interval_count"),
             "rates_source": data.get("rates_source"),
-            "description": "Import cost reconstructed from inferred TOU and CL2 components, for comparison against the API's own daily cost",
+            "description": _DESC_RECONSTRUCTED_IMPORT_COST,
         }
@@ -9,25 +9,54 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 # Add the project root to the path so we can import custom_components
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the suite's custom markers."""
+    config.addinivalue_line(
+        "markers", "unit: fast, pure-logic tests with no event loop (select with -m unit)"
+    )
+    config.addinivalue_line(
+        "markers", "integration: tests backed by a coordinator's data (select with -m integration)"
+    )
+
+
+@pytest.fixture(scope="session")
+def integration_sources() -> dict[str, str]:
+    """Read the integration's Python sources once per session, keyed by file name."""
+    integration_path = project_root / "custom_components" / "red_energy"
+    return {path.name: path.read_text() for path in integration_path.glob("*.py")}
+
+
+@pytest.fixture
+def assert_all_logged(caplog):
+    """Return a checker asserting each needle appears in the captured log text."""
+    def _check(*needles: str) -> None:
+        log_text = caplog.text
+        missing = [needle for needle in needles if needle not in log_text]
+        assert not missing, f"Not logged: {missing}"
+    return _check
 
 
 @pytest.fixture
-async def hass():
+def hass():
     """Create a minimal Home Assistant instance for testing."""
     hass_instance = MagicMock(spec=HomeAssistant)
     hass_instance.data = {}
+    hass_instance.config = MagicMock()
+    hass_instance.bus = MagicMock()
     hass_instance.config_entries = MagicMock()
     hass_instance.config_entries._entries = {}
     hass_instance.async_block_till_done = MagicMock(return_value=None)
-    
+
     # Create real device and entity registries
     device_registry_instance = dr.DeviceRegistry(hass_instance)
     entity_registry_instance = er.EntityRegistry(hass_instance)
-    
+
     # Mock the async_get functions to return our instances
     with pytest.MonkeyPatch.context() as mp:
         mp.setattr(dr, "async_get", lambda h: device_registry_instance)
         mp.setattr(er, "async_get", lambda h: entity_registry_instance)
         yield hass_instance
-
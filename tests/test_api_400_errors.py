@@ -1,45 +1,62 @@
 """Tests for API 400 error handling."""
 import logging
+import aiohttp
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import pytest_asyncio
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
 from datetime import datetime
-from aiohttp import ClientResponseError
-from custom_components.red_energy.api import RedEnergyAPI, RedEnergyAPIError
+from custom_components.red_energy.api import RedEnergyAPI
 
 
-@pytest.fixture
-def api_client():
-    """Create API client for testing."""
-    session = MagicMock()
-    return RedEnergyAPI(session)
+@pytest_asyncio.fixture
+async def make_api():
+    """Return a factory serving one canned usage response from a local aiohttp server.
+
+    The client talks to the server over a real socket, so URL building, query
+    encoding, response decoding and raise_for_status all run unmocked.
+    """
+    servers = []
+    session = aiohttp.ClientSession()
+
+    async def _make(status=200, payload=None, text=None):
+        requests = []
+
+        async def handle_usage(request):
+            requests.append(request)
+            if text is not None:
+                return web.Response(status=status, text=text)
+            return web.json_response(payload, status=status)
+
+        app = web.Application()
+        app.router.add_get("/v1/usage/interval", handle_usage)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+
+        api_client = RedEnergyAPI(session)
+        api_client.BASE_API_URL = str(server.make_url("/v1"))
+        api_client._access_token = "test_token"
+        return api_client, requests
+
+    yield _make
+
+    await session.close()
+    for server in servers:
+        await server.close()
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_400_error_with_json_response(api_client):
+async def test_get_usage_data_400_error_with_json_response(make_api):
     """Test 400 error handling with JSON error response."""
-    # Mock the session and response
-    mock_response = AsyncMock()
-    mock_response.status = 400
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=123&fromDate=2024-01-01&toDate=2024-01-02"
-    
-    # Mock JSON error response
-    error_data = {
+    api_client, _ = await make_api(400, {
         "message": "Invalid consumer number",
         "details": "Consumer number 123 is not valid for this account"
-    }
-    mock_response.json = AsyncMock(return_value=error_data)
-    
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-    
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
-    
+    })
+
     # Call the method
     result = await api_client.get_usage_data("123", datetime(2024, 1, 1), datetime(2024, 1, 2))
-    
+
     # Verify error response structure
     assert result["error"] is True
     assert result["error_type"] == "bad_request"
@@ -52,27 +69,13 @@ async def test_get_usage_data_400_error_with_json_response(api_client):
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_400_error_without_json_response(api_client):
+async def test_get_usage_data_400_error_without_json_response(make_api):
     """Test 400 error handling when JSON parsing fails."""
-    # Mock the session and response
-    mock_response = AsyncMock()
-    mock_response.status = 400
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=123&fromDate=2024-01-01&toDate=2024-01-02"
-    
-    # Mock JSON parsing failure
-    mock_response.json = AsyncMock(side_effect=Exception("Invalid JSON"))
-    
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-    
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
-    
+    api_client, _ = await make_api(400, text="Invalid JSON")
+
     # Call the method
     result = await api_client.get_usage_data("123", datetime(2024, 1, 1), datetime(2024, 1, 2))
-    
+
     # Verify error response structure with fallback values
     assert result["error"] is True
     assert result["error_type"] == "bad_request"
@@ -85,28 +88,13 @@ async def test_get_usage_data_400_error_without_json_response(api_client):
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_400_error_with_missing_fields(api_client):
+async def test_get_usage_data_400_error_with_missing_fields(make_api):
     """Test 400 error handling with missing error fields."""
-    # Mock the session and response
-    mock_response = AsyncMock()
-    mock_response.status = 400
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=123&fromDate=2024-01-01&toDate=2024-01-02"
-    
-    # Mock JSON response with missing fields
-    error_data = {}
-    mock_response.json = AsyncMock(return_value=error_data)
-    
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-    
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
-    
+    api_client, _ = await make_api(400, {})
+
     # Call the method
     result = await api_client.get_usage_data("123", datetime(2024, 1, 1), datetime(2024, 1, 2))
-    
+
     # Verify error response structure with default values
     assert result["error"] is True
     assert result["error_type"] == "bad_request"
@@ -119,25 +107,9 @@ async def test_get_usage_data_400_error_with_missing_fields(api_client):
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_other_http_errors_still_raise(api_client):
+async def test_get_usage_data_other_http_errors_still_raise(make_api):
     """Test that non-400 HTTP errors still raise exceptions."""
-    # Mock the session and response
-    mock_response = MagicMock()
-    mock_response.status = 500
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=123&fromDate=2024-01-01&toDate=2024-01-02"
-    mock_response.raise_for_status = MagicMock(
-        side_effect=ClientResponseError(
-            request_info=MagicMock(), history=(), status=500
-        )
-    )
-
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
+    api_client, _ = await make_api(500, {})
 
     # Call the method and expect it to raise
     with pytest.raises(ClientResponseError):
@@ -145,13 +117,9 @@ async def test_get_usage_data_other_http_errors_still_raise(api_client):
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_success_response(api_client):
+async def test_get_usage_data_success_response(make_api):
     """Test successful API response is processed normally."""
-    # Mock the session and response
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.raise_for_status = MagicMock()
-    mock_response.json = AsyncMock(return_value=[{
+    api_client, requests = await make_api(200, [{
         "usageDate": "2024-01-01",
         "halfHours": [
             {
@@ -164,18 +132,10 @@ async def test_get_usage_data_success_response(api_client):
             }
         ],
     }])
-    
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-    
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
-    
+
     # Call the method
     result = await api_client.get_usage_data("123", datetime(2024, 1, 1), datetime(2024, 1, 2))
-    
+
     # Verify normal processing
     assert "error" not in result
     assert result["consumer_number"] == "123"
@@ -185,39 +145,36 @@ async def test_get_usage_data_success_response(api_client):
     assert result["usage_data"][0]["date"] == "2024-01-01"
     assert result["usage_data"][0]["usage"] == 10.5
 
+    # Verify the request the server actually received
+    assert requests[0].headers["Authorization"] == "Bearer test_token"
+    assert dict(requests[0].query) == {
+        "consumerNumber": "123",
+        "fromDate": "2024-01-01",
+        "toDate": "2024-01-02",
+    }
+
 
 @pytest.mark.asyncio
-async def test_get_usage_data_logging_on_400_error(api_client, caplog):
+async def test_get_usage_data_logging_on_400_error(make_api, caplog, assert_all_logged):
     """Test that 400 errors are logged with detailed information."""
-    # Mock the session and response
-    mock_response = AsyncMock()
-    mock_response.status = 400
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=123&fromDate=2024-01-01&toDate=2024-01-02"
-    
-    error_data = {
+    api_client, _ = await make_api(400, {
         "message": "Invalid consumer number",
         "details": "Consumer number 123 is not valid for this account"
-    }
-    mock_response.json = AsyncMock(return_value=error_data)
-    
-    # Mock the session context manager
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-    
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
-    
+    })
+
     # Call the method
     await api_client.get_usage_data("123", datetime(2024, 1, 1), datetime(2024, 1, 2))
 
     # Verify error logging
-    assert "400 Bad Request for usage data" in caplog.text
-    assert "Consumer: 123" in caplog.text
-    assert "Date Range: 2024-01-01 to 2024-01-02" in caplog.text
-    assert "Error: Invalid consumer number" in caplog.text
-    assert "Details: Consumer number 123 is not valid for this account" in caplog.text
-    assert "URL: https://api.example.com/usage/interval" in caplog.text
+    assert_all_logged(
+        "400 Bad Request for usage data",
+        "Consumer: 123",
+        "Date Range: 2024-01-01 to 2024-01-02",
+        "Error: Invalid consumer number",
+        "Details: Consumer number 123 is not valid for this account",
+        "URL: http://127.0.0.1",
+        "/v1/usage/interval?consumerNumber=123",
+    )
 
     # A genuine error (not the BASIC/gas no-interval-usage case) must still
     # log at ERROR level so it's visible without enabling debug logging.
@@ -226,32 +183,23 @@ async def test_get_usage_data_logging_on_400_error(api_client, caplog):
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data_basic_meter_400_logs_at_debug_not_error(api_client, caplog):
+async def test_get_usage_data_basic_meter_400_logs_at_debug_not_error(make_api, caplog):
     """A BASIC/manual-read gas meter's 400 is expected behaviour, not a failure.
 
     Red Energy returns this same 400 on every request for a non-interval
     meter - logging it at ERROR is misleading noise for something that will
     never resolve differently, so it must log at debug instead.
     """
-    mock_response = AsyncMock()
-    mock_response.status = 400
-    mock_response.url = "https://api.example.com/usage/interval?consumerNumber=4000004&fromDate=2024-01-01&toDate=2024-01-02"
-
-    error_data = {
-        "message": (
-            "customerNumber=5000005, consumerNumber=4000004 has a BASIC "
-            "meter or is for a Gas utility so does not have interval usages"
-        ),
-        "details": "No additional details",
-    }
-    mock_response.json = AsyncMock(return_value=error_data)
-
-    async def mock_context_manager(*args, **kwargs):
-        return mock_response
-
-    api_client._session.get.return_value.__aenter__ = mock_context_manager
-    api_client._session.get.return_value.__aexit__ = AsyncMock(return_value=None)
-    api_client._access_token = "test_token"
+    api_client, _ = await make_api(
+        400,
+        {
+            "message": (
+                "customerNumber=5000005, consumerNumber=4000004 has a BASIC "
+                "meter or is for a Gas utility so does not have interval usages"
+            ),
+            "details": "No additional details",
+        },
+    )
 
     with caplog.at_level(logging.DEBUG, logger="custom_components.red_energy.api"):
         result = await api_client.get_usage_data("4000004", datetime(2024, 1, 1), datetime(2024, 1, 2))
@@ -1,5 +1,6 @@
 """Tests for concurrent authenticate() calls not racing each other."""
 import asyncio
+from datetime import datetime, timedelta
 import pytest
 from unittest.mock import AsyncMock
 from custom_components.red_energy.api import RedEnergyAPI
@@ -101,3 +102,28 @@ async def test_authenticate_clears_stale_auth_cookies_before_starting(monkeypatc
     assert session.cookie_jar.clear_domain.call_count == len(RedEnergyAPI.OKTA_COOKIE_DOMAINS)
     cleared_domains = {call.args[0] for call in session.cookie_jar.clear_domain.call_args_list}
     assert cleared_domains == set(RedEnergyAPI.OKTA_COOKIE_DOMAINS)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_expired_token_checks_refresh_once(api_client, monkeypatch):
+    """Usage fetches run concurrently, so several can find the token expired
+    at once - only the first may refresh it, the rest must reuse the result."""
+    api_client._access_token = "expired_token"
+    api_client._refresh_token = "refresh_token"
+    api_client._token_expires = datetime.now() - timedelta(minutes=1)
+
+    refresh_calls = 0
+
+    async def fake_refresh_access_token():
+        nonlocal refresh_calls
+        refresh_calls += 1
+        await asyncio.sleep(0.01)
+        api_client._access_token = "access_token"
+        api_client._token_expires = datetime.now() + timedelta(hours=1)
+
+    monkeypatch.setattr(api_client, "_refresh_access_token", fake_refresh_access_token)
+
+    await asyncio.gather(*(api_client._ensure_valid_token() for _ in range(3)))
+
+    assert refresh_calls == 1
+    assert api_client._access_token == "access_token"
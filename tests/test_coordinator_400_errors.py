@@ -1,25 +1,64 @@
 """Tests for coordinator 400 error handling."""
+import asyncio
+import copy
 import logging
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta, timezone
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from custom_components.red_energy.coordinator import RedEnergyDataCoordinator
 from custom_components.red_energy.api import RedEnergyAPIError
+from custom_components.red_energy.data_validation import validate_usage_data
 
 RECENT_BILL_DATE = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
 
 
-@pytest.fixture
+def _prop(pid, consumer_number, name=None, active=True, types=("electricity",)):
+    """Build a property with one service per type, all on the same consumer number."""
+    return {
+        "id": pid,
+        "name": name or f"Property {pid}",
+        "services": [
+            {
+                "type": service_type,
+                "consumer_number": consumer_number,
+                "active": active,
+                "lastBillDate": RECENT_BILL_DATE,
+            }
+            for service_type in types
+        ],
+    }
+
+
+def _usage(consumer_number, start_date, end_date):
+    """Build a successful usage response for a consumer."""
+    return {
+        "consumer_number": consumer_number,
+        "from_date": start_date.strftime('%Y-%m-%d'),
+        "to_date": end_date.strftime('%Y-%m-%d'),
+        "usage_data": [{"date": "2024-01-01", "usage": 15.0, "cost": 25.00}],
+    }
+
+
+def _usage_by_consumer(responses):
+    """Mock get_usage_data, answering each consumer number from a dict."""
+    return AsyncMock(
+        side_effect=lambda consumer_number, start_date, end_date: responses[consumer_number]
+    )
+
+
+PROPERTIES = [_prop("prop1", "1234567890"), _prop("prop2", "0987654321")]
+
+
+@pytest.fixture(scope="module")
 def mock_hass():
     """Create mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.async_add_executor_job = AsyncMock()
-    return hass
+    return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def coordinator(mock_hass):
-    """Create coordinator for testing."""
+    """Create coordinator for testing, shared by the module's tests."""
     with patch(
         "custom_components.red_energy.coordinator.async_get_clientsession",
         return_value=MagicMock(),
@@ -31,79 +70,52 @@ def coordinator(mock_hass):
             selected_accounts=["prop1", "prop2"],
             services=["electricity"]
         )
-    
+    return coordinator
+
+
+@pytest.fixture(autouse=True)
+def reset_coordinator(coordinator):
+    """Restore the state tests mutate on the shared coordinator."""
     # Mock the API
     coordinator.api = AsyncMock()
     coordinator.api._access_token = "test_token"
-    
+
     # Mock properties data
-    coordinator._properties = [
-        {
-            "id": "prop1",
-            "name": "Property 1",
-            "services": [
-                {
-                    "type": "electricity",
-                    "consumer_number": "1234567890",
-                    "active": True,
-                    "lastBillDate": RECENT_BILL_DATE
-                }
-            ]
-        },
-        {
-            "id": "prop2", 
-            "name": "Property 2",
-            "services": [
-                {
-                    "type": "electricity",
-                    "consumer_number": "0987654321",
-                    "active": True,
-                    "lastBillDate": RECENT_BILL_DATE
-                }
-            ]
-        }
-    ]
-    
+    coordinator._properties = copy.deepcopy(PROPERTIES)
+
     # Mock customer data
     coordinator._customer_data = {"id": "customer1", "name": "Test Customer"}
     # Prevent _async_update_data from triggering a metadata refresh (which would
     # hit the AsyncMock'd get_customer_data/get_properties and fail validation).
     coordinator._last_metadata_refresh_date = datetime.now(timezone.utc).date()
 
-    return coordinator
-
 
 @pytest.mark.asyncio
-async def test_coordinator_handles_400_error_gracefully(coordinator, caplog):
+async def test_coordinator_handles_400_error_gracefully(coordinator, caplog, assert_all_logged):
     """Test that coordinator handles 400 errors and continues processing."""
     caplog.set_level(logging.INFO)
 
     # Mock API to return 400 error for first property, success for second
-    def mock_get_usage_data(consumer_number, start_date, end_date):
-        if consumer_number == "1234567890":
-            # Return 400 error for first property
-            return {
-                "error": True,
-                "error_type": "bad_request",
-                "error_message": "Invalid consumer number",
-                "error_details": "Consumer number 1234567890 is not valid",
-                "consumer_number": consumer_number,
-                "from_date": start_date.strftime('%Y-%m-%d'),
-                "to_date": end_date.strftime('%Y-%m-%d'),
-                "usage_data": []
-            }
-        else:
-            # Return success for second property
-            return {
-                "consumer_number": consumer_number,
-                "from_date": start_date.strftime('%Y-%m-%d'),
-                "to_date": end_date.strftime('%Y-%m-%d'),
-                "usage_data": [
-                    {"date": "2024-01-01", "usage": 15.5, "cost": 25.50}
-                ]
-            }
-    
-    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+    coordinator.api.get_usage_data = _usage_by_consumer({
+        "1234567890": {
+            "error": True,
+            "error_type": "bad_request",
+            "error_message": "Invalid consumer number",
+            "error_details": "Consumer number 1234567890 is not valid",
+            "consumer_number": "1234567890",
+            "from_date": "2024-01-01",
+            "to_date": "2024-01-02",
+            "usage_data": []
+        },
+        "0987654321": {
+            "consumer_number": "0987654321",
+            "from_date": "2024-01-01",
+            "to_date": "2024-01-02",
+            "usage_data": [
+                {"date": "2024-01-01", "usage": 15.5, "cost": 25.50}
+            ]
+        },
+    })
     
     # Call the update method
     result = await coordinator._async_update_data()
@@ -117,9 +129,11 @@ async def test_coordinator_handles_400_error_gracefully(coordinator, caplog):
     assert result["usage_data"]["prop1"]["services"] == {}
     
     # Verify warning was logged for the failed service
-    assert "API returned error for electricity service (consumer 1234567890)" in caplog.text
-    assert "Invalid consumer number" in caplog.text
-    assert "Skipping this service but continuing with others" in caplog.text
+    assert_all_logged(
+        "API returned error for electricity service (consumer 1234567890)",
+        "Invalid consumer number",
+        "Skipping this service but continuing with others",
+    )
     
     # Verify success was logged for the working service
     assert "Successfully fetched electricity usage for property prop2" in caplog.text
@@ -164,18 +178,7 @@ async def test_coordinator_logs_unselected_property_as_info_not_warning(coordina
     it must log at INFO, not WARNING."""
     caplog.set_level(logging.INFO)
 
-    coordinator._properties.append({
-        "id": "prop3",
-        "name": "Unselected Property",
-        "services": [
-            {
-                "type": "electricity",
-                "consumer_number": "5555555555",
-                "active": True,
-                "lastBillDate": RECENT_BILL_DATE
-            }
-        ]
-    })
+    coordinator._properties.append(_prop("prop3", "5555555555", name="Unselected Property"))
 
     coordinator.api.get_usage_data = AsyncMock(return_value={
         "consumer_number": "0",
@@ -229,32 +232,27 @@ async def test_coordinator_handles_all_services_failing(coordinator, caplog):
 @pytest.mark.asyncio
 async def test_coordinator_mixed_success_and_failure(coordinator, caplog):
     """Test coordinator with some services succeeding and others failing."""
-    # Mock API responses
-    def mock_get_usage_data(consumer_number, start_date, end_date):
-        if consumer_number == "1234567890":
-            # First property fails
-            return {
-                "error": True,
-                "error_type": "bad_request",
-                "error_message": "Invalid consumer number",
-                "error_details": "Consumer number 1234567890 is not valid",
-                "consumer_number": consumer_number,
-                "from_date": start_date.strftime('%Y-%m-%d'),
-                "to_date": end_date.strftime('%Y-%m-%d'),
-                "usage_data": []
-            }
-        else:
-            # Second property succeeds
-            return {
-                "consumer_number": consumer_number,
-                "from_date": start_date.strftime('%Y-%m-%d'),
-                "to_date": end_date.strftime('%Y-%m-%d'),
-                "usage_data": [
-                    {"date": "2024-01-01", "usage": 20.0, "cost": 35.00}
-                ]
-            }
-    
-    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+    # Mock API responses: first property fails, second succeeds
+    coordinator.api.get_usage_data = _usage_by_consumer({
+        "1234567890": {
+            "error": True,
+            "error_type": "bad_request",
+            "error_message": "Invalid consumer number",
+            "error_details": "Consumer number 1234567890 is not valid",
+            "consumer_number": "1234567890",
+            "from_date": "2024-01-01",
+            "to_date": "2024-01-02",
+            "usage_data": []
+        },
+        "0987654321": {
+            "consumer_number": "0987654321",
+            "from_date": "2024-01-01",
+            "to_date": "2024-01-02",
+            "usage_data": [
+                {"date": "2024-01-01", "usage": 20.0, "cost": 35.00}
+            ]
+        },
+    })
     
     # Call the update method
     result = await coordinator._async_update_data()
@@ -274,63 +272,190 @@ async def test_coordinator_mixed_success_and_failure(coordinator, caplog):
     electricity_data = prop2_data["services"]["electricity"]
     assert electricity_data["consumer_number"] == "0987654321"
     assert len(electricity_data["usage_data"]["usage_data"]) == 1
+    assert electricity_data["daily_count"] == 1
     assert electricity_data["usage_data"]["usage_data"][0]["usage"] == 20.0
 
+    # Both services are fetched, in no particular order
+    assert coordinator.api.get_usage_data.call_count == 2
+    assert {call.args[0] for call in coordinator.api.get_usage_data.call_args_list} == {
+        "1234567890", "0987654321"
+    }
+
 
 @pytest.mark.asyncio
-async def test_coordinator_skips_inactive_services(coordinator):
-    """Test that coordinator skips inactive services."""
-    # Set one service as inactive
-    coordinator._properties[0]["services"][0]["active"] = False
-    
-    # Mock API (should not be called for inactive service)
-    coordinator.api.get_usage_data = AsyncMock(return_value={
-        "consumer_number": "0987654321",
-        "from_date": "2024-01-01",
-        "to_date": "2024-01-02",
-        "usage_data": [{"date": "2024-01-01", "usage": 15.0, "cost": 25.00}]
-    })
-    
+async def test_coordinator_fetches_services_concurrently(coordinator):
+    """Test that usage fetches overlap rather than running one after another."""
+    both_started = asyncio.Event()
+    started = []
+
+    async def mock_get_usage_data(consumer_number, start_date, end_date):
+        started.append(consumer_number)
+        if len(started) == 2:
+            both_started.set()
+        # Only completes once every fetch is in flight - a serial loop would
+        # never start the second one and time out here.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return {
+            "consumer_number": consumer_number,
+            "from_date": start_date.strftime('%Y-%m-%d'),
+            "to_date": end_date.strftime('%Y-%m-%d'),
+            "usage_data": [{"date": "2024-01-01", "usage": 20.0, "cost": 35.00}],
+        }
+
+    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+
+    result = await coordinator._async_update_data()
+
+    assert sorted(started) == ["0987654321", "1234567890"]
+    assert result["usage_data"]["prop1"]["services"]["electricity"]["consumer_number"] == "1234567890"
+    assert result["usage_data"]["prop2"]["services"]["electricity"]["consumer_number"] == "0987654321"
+
+
+@pytest.mark.asyncio
+async def test_coordinator_processes_fetches_as_they_complete(coordinator):
+    """Test that a fast response is validated before a slow one arrives."""
+    fast_validated = asyncio.Event()
+
+    async def mock_get_usage_data(consumer_number, start_date, end_date):
+        if consumer_number == "1234567890":
+            # Only completes once the other response has been validated -
+            # waiting for every fetch before validating would time out here.
+            await asyncio.wait_for(fast_validated.wait(), timeout=1)
+        return {
+            "consumer_number": consumer_number,
+            "from_date": start_date.strftime('%Y-%m-%d'),
+            "to_date": end_date.strftime('%Y-%m-%d'),
+            "usage_data": [{"date": "2024-01-01", "usage": 20.0, "cost": 35.00}],
+        }
+
+    def mock_validate_usage_data(data):
+        if data["consumer_number"] == "0987654321":
+            fast_validated.set()
+        return validate_usage_data(data)
+
+    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+
+    with patch(
+        "custom_components.red_energy.coordinator.validate_usage_data",
+        side_effect=mock_validate_usage_data,
+    ):
+        result = await coordinator._async_update_data()
+
+    assert "electricity" in result["usage_data"]["prop1"]["services"]
+    assert "electricity" in result["usage_data"]["prop2"]["services"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_stores_services_in_fetch_order(coordinator, monkeypatch):
+    """Test that services keep their fetch order, whichever response arrives first."""
+    monkeypatch.setattr(coordinator, "services", ["electricity", "gas"])
+    prop = _prop("prop1", "1234567890")
+    prop["services"].append({**prop["services"][0], "type": "gas", "consumer_number": "5555555555"})
+    coordinator._properties = [prop]
+
+    async def mock_get_usage_data(consumer_number, start_date, end_date):
+        if consumer_number == "1234567890":
+            # Electricity answers last
+            await asyncio.sleep(0.01)
+        return _usage(consumer_number, start_date, end_date)
+
+    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+
+    result = await coordinator._async_update_data()
+
+    assert list(result["usage_data"]["prop1"]["services"]) == ["electricity", "gas"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_cancels_pending_fetches_on_unexpected_error(coordinator):
+    """Test that an unexpected validation error cancels the fetches still in flight."""
+    slow_cancelled = asyncio.Event()
+
+    async def mock_get_usage_data(consumer_number, start_date, end_date):
+        if consumer_number == "1234567890":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+        return _usage(consumer_number, start_date, end_date)
+
+    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+
+    with patch(
+        "custom_components.red_energy.coordinator.validate_usage_data",
+        side_effect=TypeError("unexpected"),
+    ), pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    await asyncio.wait_for(slow_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_continues_when_one_fetch_raises(coordinator):
+    """Test that an API exception for one service doesn't drop the others."""
+    def mock_get_usage_data(consumer_number, start_date, end_date):
+        if consumer_number == "1234567890":
+            raise RedEnergyAPIError("Connection reset")
+        return {
+            "consumer_number": consumer_number,
+            "from_date": start_date.strftime('%Y-%m-%d'),
+            "to_date": end_date.strftime('%Y-%m-%d'),
+            "usage_data": [{"date": "2024-01-01", "usage": 20.0, "cost": 35.00}],
+        }
+
+    coordinator.api.get_usage_data = AsyncMock(side_effect=mock_get_usage_data)
+
+    result = await coordinator._async_update_data()
+
+    assert result["usage_data"]["prop1"]["services"] == {}
+    assert "electricity" in result["usage_data"]["prop2"]["services"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_reads_clock_once_per_update(coordinator):
+    """Test that every service's usage period ends at the same instant."""
+    coordinator.api.get_usage_data = AsyncMock(side_effect=_usage)
+
+    await coordinator._async_update_data()
+
+    end_dates = {call.args[2] for call in coordinator.api.get_usage_data.call_args_list}
+    assert len(end_dates) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("active", [True, False])
+async def test_coordinator_skips_inactive_services(coordinator, active):
+    """Test that coordinator only fetches usage for active services."""
+    coordinator._properties[0] = _prop("prop1", "1234567890", active=active)
+    coordinator.api.get_usage_data = AsyncMock(side_effect=_usage)
+
     # Call the update method
     result = await coordinator._async_update_data()
-    
-    # Verify only the active service was processed
-    assert coordinator.api.get_usage_data.call_count == 1
-    assert coordinator.api.get_usage_data.call_args[0][0] == "0987654321"  # Second property's consumer number
-    
-    # Verify result contains the active service; the inactive-only property
+
+    # Verify the inactive service was never fetched
+    called = {call.args[0] for call in coordinator.api.get_usage_data.call_args_list}
+    assert called == ({"1234567890", "0987654321"} if active else {"0987654321"})
+
+    # Verify result contains the active service; an inactive-only property
     # is still present (metadata-only), just with no services collected
-    assert "usage_data" in result
-    assert "prop2" in result["usage_data"]
-    assert "prop1" in result["usage_data"]
-    assert result["usage_data"]["prop1"]["services"] == {}
+    assert "electricity" in result["usage_data"]["prop2"]["services"]
+    assert ("electricity" in result["usage_data"]["prop1"]["services"]) is active
 
 
 @pytest.mark.asyncio
 async def test_coordinator_skips_unconfigured_services(coordinator):
     """Test that coordinator skips services not in configured services list."""
     # Add a gas service that's not in the configured services
-    coordinator._properties[0]["services"].append({
-        "type": "gas",
-        "consumer_number": "1111111111",
-        "active": True,
-        "lastBillDate": RECENT_BILL_DATE
-    })
-    
-    # Mock API (should only be called for electricity service)
-    coordinator.api.get_usage_data = AsyncMock(return_value={
-        "consumer_number": "1234567890",
-        "from_date": "2024-01-01", 
-        "to_date": "2024-01-02",
-        "usage_data": [{"date": "2024-01-01", "usage": 10.0, "cost": 15.00}]
-    })
-    
+    coordinator._properties[0] = _prop("prop1", "1234567890", types=("electricity", "gas"))
+    coordinator.api.get_usage_data = AsyncMock(side_effect=_usage)
+
     # Call the update method
     result = await coordinator._async_update_data()
-    
+
     # Verify only electricity service was processed (2 calls for 2 properties)
     assert coordinator.api.get_usage_data.call_count == 2
-    
+
     # Verify result contains only electricity services
     for prop_data in result["usage_data"].values():
         assert "electricity" in prop_data["services"]
@@ -338,7 +463,7 @@ async def test_coordinator_skips_unconfigured_services(coordinator):
 
 
 @pytest.mark.asyncio
-async def test_coordinator_logs_debug_information(coordinator, caplog):
+async def test_coordinator_logs_debug_information(coordinator, caplog, assert_all_logged):
     """Test that coordinator logs debug information during processing."""
     # Enable debug logging
     import logging
@@ -356,10 +481,12 @@ async def test_coordinator_logs_debug_information(coordinator, caplog):
     await coordinator._async_update_data()
     
     # Verify debug logs were generated
-    assert "COORDINATOR CONFIGURATION:" in caplog.text
-    assert "Processing property:" in caplog.text
-    assert "Property has" in caplog.text
-    assert "Processing service:" in caplog.text
-    assert "Service electricity MATCHED" in caplog.text
-    assert "Calling API get_usage_data:" in caplog.text
-    assert "DATA COLLECTION SUMMARY:" in caplog.text
+    assert_all_logged(
+        "COORDINATOR CONFIGURATION:",
+        "Processing property:",
+        "Property has",
+        "Processing service:",
+        "Service electricity MATCHED",
+        "Calling API get_usage_data:",
+        "DATA COLLECTION SUMMARY:",
+    )
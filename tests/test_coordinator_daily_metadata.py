@@ -1,36 +1,40 @@
 """Tests for daily metadata refresh logic in coordinator."""
 from __future__ import annotations
 
-import os
-from datetime import date, datetime, timezone
+import ast
+import asyncio
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 
-def test_coordinator_daily_metadata_methods_exist():
-    """Ensure coordinator exposes daily metadata refresh methods and fields."""
-    coordinator_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "custom_components", "red_energy", "coordinator.py",
-    )
-    assert os.path.exists(coordinator_path)
 
-    with open(coordinator_path, 'r') as f:
-        content = f.read()
+def test_coordinator_daily_metadata_methods_exist(integration_sources):
+    """Ensure coordinator exposes daily metadata refresh methods and fields."""
+    tree = ast.parse(integration_sources["coordinator.py"])
+    functions = {n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)}
+    async_functions = {n.name for n in ast.walk(tree) if isinstance(n, ast.AsyncFunctionDef)}
+    attributes = {n.attr for n in ast.walk(tree) if isinstance(n, ast.Attribute)}
 
     # New daily metadata refresh components
-    assert "_last_metadata_refresh_date" in content
-    assert "def _should_refresh_metadata_today" in content
-    assert "async def _async_refresh_metadata" in content
-    assert "async def async_refresh_metadata_and_usage" in content
+    assert "_last_metadata_refresh_date" in attributes
+    assert "_should_refresh_metadata_today" in functions
+    assert {"_async_refresh_metadata", "async_refresh_metadata_and_usage"} <= async_functions
 
     # Ensure guarded call within _async_update_data
-    assert "_should_refresh_metadata_today()" in content or "_async_refresh_metadata()" in content
+    update_data = next(
+        n for n in ast.walk(tree)
+        if isinstance(n, ast.AsyncFunctionDef) and n.name == "_async_update_data"
+    )
+    called = {
+        n.func.attr for n in ast.walk(update_data)
+        if isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute)
+    }
+    assert called & {"_should_refresh_metadata_today", "_async_refresh_metadata"}
 
 
 def test_coordinator_daily_refresh_behavior():
     """Test that metadata is only refreshed once per calendar day."""
-    from datetime import date, timezone
-    
     # Test the calendar day logic directly
     class MockCoordinator:
         def __init__(self):
@@ -55,8 +59,55 @@ def test_coordinator_daily_refresh_behavior():
     assert coordinator._should_refresh_metadata_today() == False
     
     # Test 3: Next day should refresh
-    yesterday = date.today().replace(day=date.today().day - 1) if date.today().day > 1 else date.today().replace(month=date.today().month - 1, day=28)
+    yesterday = today - timedelta(days=1)
     coordinator._last_metadata_refresh_date = yesterday
     assert coordinator._should_refresh_metadata_today() == True
 
 
+@pytest.mark.asyncio
+async def test_metadata_refresh_fetches_customer_and_properties_concurrently():
+    """Test that the customer and properties requests overlap."""
+    from custom_components.red_energy.coordinator import RedEnergyDataCoordinator
+
+    with patch(
+        "custom_components.red_energy.coordinator.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        coordinator = RedEnergyDataCoordinator(
+            hass=MagicMock(),
+            username="test_user",
+            password="test_pass",
+            selected_accounts=["1000001"],
+            services=["electricity"],
+        )
+
+    both_started = asyncio.Event()
+    started = []
+
+    async def mock_request(name, response):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # Only completes once both requests are in flight - awaiting them one
+        # after another would never start the second and time out here.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return response
+
+    properties = [{"id": "1000001", "name": "1 Example Street, Testville"}]
+    coordinator.api = MagicMock()
+    coordinator.api.get_customer_data = lambda: mock_request("customer", {"id": "2000002"})
+    coordinator.api.get_properties = lambda: mock_request("properties", properties)
+
+    with patch(
+        "custom_components.red_energy.coordinator.validate_customer_data",
+        side_effect=lambda data: data,
+    ), patch(
+        "custom_components.red_energy.coordinator.validate_properties_data",
+        side_effect=lambda data: data,
+    ):
+        await coordinator._async_refresh_metadata()
+
+    assert sorted(started) == ["customer", "properties"]
+    assert coordinator._customer_data == {"id": "2000002"}
+    assert coordinator._properties == properties
+    assert coordinator._last_metadata_refresh_date == datetime.now(timezone.utc).date()
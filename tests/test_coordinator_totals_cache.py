@@ -0,0 +1,98 @@
+"""Tests for the coordinator's per-update memoization of period totals."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.red_energy.coordinator import RedEnergyDataCoordinator
+from custom_components.red_energy.const import SERVICE_TYPE_ELECTRICITY
+
+
+@pytest.fixture
+def mock_hass():
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock()
+    return hass
+
+
+@pytest.fixture
+def coordinator(mock_hass):
+    with patch(
+        "custom_components.red_energy.coordinator.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        coord = RedEnergyDataCoordinator(
+            hass=mock_hass,
+            username="test_user",
+            password="test_pass",
+            selected_accounts=["prop-001"],
+            services=["electricity"],
+        )
+    coord.api = AsyncMock()
+    coord.api._access_token = "test_token"
+    return coord
+
+
+def _usage_data(usage_entries):
+    return {
+        "usage_data": {
+            "prop-001": {
+                "property": {"services": [{"type": "electricity"}]},
+                "services": {
+                    "electricity": {
+                        "consumer_number": "elec-123",
+                        "usage_data": {
+                            "from_date": "2026-07-01",
+                            "to_date": "2026-07-02",
+                            "usage_data": usage_entries,
+                        },
+                    }
+                },
+            }
+        }
+    }
+
+
+def test_totals_computed_once_per_update(coordinator):
+    coordinator.data = _usage_data([
+        {"date": "2026-07-01", "import_usage": 10.0, "export_usage": 1.0, "peak_import_usage": 4.0},
+        {"date": "2026-07-02", "import_usage": 5.0, "export_usage": 2.0, "peak_import_usage": 3.0},
+    ])
+
+    with patch.object(coordinator, "get_service_usage", wraps=coordinator.get_service_usage) as spy:
+        assert coordinator.get_total_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY) == 15.0
+        assert coordinator.get_total_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY) == 15.0
+        assert coordinator.get_total_export_usage("prop-001", SERVICE_TYPE_ELECTRICITY) == 3.0
+        assert coordinator.get_period_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY, "peak") == 7.0
+        assert coordinator.get_period_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY, "offpeak") == 0
+        assert coordinator.get_total_import_cost("prop-001", SERVICE_TYPE_ELECTRICITY) == 0
+
+    # Every total comes from a single pass over the service's usage
+    assert spy.call_count == 1
+
+
+def test_emission_factor_derived_from_cached_totals(coordinator):
+    coordinator.data = _usage_data([
+        {"date": "2026-07-01", "import_usage": 40.0, "carbon_emission_tonne": 0.03},
+        {"date": "2026-07-02", "import_usage": 10.0, "carbon_emission_tonne": 0.01},
+    ])
+
+    assert coordinator.get_emission_factor("prop-001", SERVICE_TYPE_ELECTRICITY) == 0.8
+
+
+def test_emission_factor_zero_without_import(coordinator):
+    coordinator.data = _usage_data([{"date": "2026-07-01", "carbon_emission_tonne": 0.01}])
+
+    assert coordinator.get_emission_factor("prop-001", SERVICE_TYPE_ELECTRICITY) == 0.0
+
+
+def test_totals_recomputed_when_data_replaced(coordinator):
+    coordinator.data = _usage_data([{"date": "2026-07-01", "import_usage": 10.0}])
+    assert coordinator.get_total_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY) == 10.0
+
+    coordinator.data = _usage_data([{"date": "2026-07-01", "import_usage": 4.0}])
+    assert coordinator.get_total_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY) == 4.0
+
+
+def test_totals_none_without_usage_data(coordinator):
+    coordinator.data = {"usage_data": {}}
+    assert coordinator.get_total_import_usage("prop-001", SERVICE_TYPE_ELECTRICITY) is None
+    assert coordinator.get_total_export_usage("prop-001", SERVICE_TYPE_ELECTRICITY) is None
@@ -1,5 +1,6 @@
 """Tests for data validation error handling."""
 import pytest
+from unittest.mock import patch
 from custom_components.red_energy.data_validation import (
     validate_usage_data,
     validate_usage_entry,
@@ -54,6 +55,23 @@ def test_validate_usage_data_with_error_response_missing_fields():
     assert "error_details" not in result
 
 
+def test_validate_usage_data_error_response_skips_entry_validation():
+    """Test error responses return before any usage entry is validated."""
+    error_response = {
+        "error": True,
+        "consumer_number": "123",
+        "usage_data": [{"date": "2024-01-01", "usage": 1.0}] * 10_000,
+    }
+
+    with patch(
+        "custom_components.red_energy.data_validation.validate_usage_entry"
+    ) as mock_validate_entry:
+        result = validate_usage_data(error_response)
+
+    assert result is error_response
+    mock_validate_entry.assert_not_called()
+
+
 def test_validate_usage_data_with_normal_data():
     """Test that normal usage data is validated as usual."""
     normal_data = {
@@ -165,6 +183,20 @@ def test_validate_usage_data_error_response_preserves_all_fields():
     assert result["nested_field"]["key"] == "value"
 
 
+def test_validate_usage_data_totals_large_payload():
+    """Test totals over a large payload, skipping entries that fail validation."""
+    usage_entries = [
+        {"date": "2024-01-01", "usage": 0.25, "cost": 0.10} for _ in range(10_000)
+    ]
+    usage_entries.append({"usage": 100.0, "cost": 100.0})  # No date - rejected
+
+    result = validate_usage_data({"consumer_number": "1000001", "usage_data": usage_entries})
+
+    assert len(result["usage_data"]) == 10_000
+    assert result["total_usage"] == 2500.0
+    assert result["total_cost"] == 1000.0
+
+
 def test_validate_usage_data_mixed_error_and_normal_data():
     """Test validation with mixed error and normal data structures."""
     # This test ensures that if somehow both error and normal data are present,
@@ -197,7 +229,7 @@ def test_validate_usage_data_mixed_error_and_normal_data():
     assert "total_cost" not in result
 
 
-def test_validate_usage_data_error_response_logging(caplog):
+def test_validate_usage_data_error_response_logging(caplog, assert_all_logged):
     """Test that error responses generate appropriate log messages."""
     error_response = {
         "error": True,
@@ -213,12 +245,14 @@ def test_validate_usage_data_error_response_logging(caplog):
     validate_usage_data(error_response)
     
     # Verify warning log was generated
-    assert "Skipping validation for error response" in caplog.text
-    assert "Test error message" in caplog.text
-    assert "Test error details" in caplog.text
+    assert_all_logged(
+        "Skipping validation for error response",
+        "Test error message",
+        "Test error details",
+    )
 
 
-def test_validate_usage_data_error_response_with_missing_error_fields_logging(caplog):
+def test_validate_usage_data_error_response_with_missing_error_fields_logging(caplog, assert_all_logged):
     """Test error response logging with missing error fields."""
     error_response = {
         "error": True,
@@ -231,9 +265,11 @@ def test_validate_usage_data_error_response_with_missing_error_fields_logging(ca
     validate_usage_data(error_response)
     
     # Verify warning log was generated with default values
-    assert "Skipping validation for error response" in caplog.text
-    assert "Unknown error" in caplog.text
-    assert "No details" in caplog.text
+    assert_all_logged(
+        "Skipping validation for error response",
+        "Unknown error",
+        "No details",
+    )
 
 
 def test_validate_address_handles_none_values():
@@ -1,43 +1,42 @@
 """Test device identifier fix - ensures only one device is created per property."""
-import sys
-from pathlib import Path
-
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
+from dataclasses import dataclass
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
+from custom_components.red_energy.config_migration import CONFIG_VERSION_5, CURRENT_CONFIG_VERSION
 from custom_components.red_energy.const import (
     DOMAIN,
+    SENSOR_TYPE_BALANCE,
+    SENSOR_TYPE_NMI,
     SERVICE_TYPE_ELECTRICITY,
     SERVICE_TYPE_GAS,
 )
+from custom_components.red_energy.device_manager import RedEnergyDeviceManager
+from custom_components.red_energy.sensor import RedEnergyBaseSensor
 
+pytestmark = pytest.mark.unit
 
-def test_device_manager_uses_account_id_identifier():
-    """Test that device_manager creates devices with (DOMAIN, account_id) identifier."""
-    # Verify the device manager would create correct identifier
-    account_id = "12345"
-    expected_identifier = (DOMAIN, account_id)
-    
-    # The identifier is created in _create_property_device method using (DOMAIN, account_id)
-    # This is the pattern that device_manager.py line 63 uses
-    assert DOMAIN == "red_energy"
-    
-    print(f"✓ Device manager uses identifier pattern: {expected_identifier}")
+
+@dataclass(frozen=True, slots=True)
+class StubCoordinator:
+    """The coordinator surface RedEnergyBaseSensor reads."""
+
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class StubEntry:
+    """The config entry surface RedEnergyBaseSensor reads."""
+
+    entry_id: str
 
 
 def test_sensor_device_info_uses_property_id():
     """Test that sensors use (DOMAIN, property_id) in device_info."""
-    from custom_components.red_energy.sensor import RedEnergyBaseSensor
-    from custom_components.red_energy.const import SENSOR_TYPE_BALANCE
-    
-    # Mock coordinator and config_entry
-    mock_coordinator = MagicMock()
-    mock_coordinator.data = {
+    # Stub coordinator and config_entry
+    mock_coordinator = StubCoordinator(data={
         "usage_data": {
             "12345": {
                 "property": {
@@ -46,10 +45,9 @@ def test_sensor_device_info_uses_property_id():
                 }
             }
         }
-    }
+    })
     
-    mock_config_entry = MagicMock()
-    mock_config_entry.entry_id = "test_entry_456"
+    mock_config_entry = StubEntry(entry_id="test_entry_456")
     
     property_id = "12345"
     service_type = SERVICE_TYPE_ELECTRICITY
@@ -73,24 +71,17 @@ def test_sensor_device_info_uses_property_id():
     # Verify it does NOT use the old pattern
     old_wrong_identifier = (DOMAIN, f"{mock_config_entry.entry_id}_{property_id}")
     assert old_wrong_identifier not in device_info["identifiers"]
-    
-    print(f"✓ Sensor uses correct identifier: {expected_identifier}")
-    print(f"✓ Sensor does NOT use old identifier: {old_wrong_identifier}")
 
 
 def test_device_identifier_matches_between_manager_and_sensor():
     """Test that device_manager and sensors use the same identifier pattern."""
-    from custom_components.red_energy.sensor import RedEnergyBaseSensor
-    from custom_components.red_energy.const import SENSOR_TYPE_BALANCE
-    
     account_id = "12345"
     
     # What device_manager would create
     device_manager_identifier = (DOMAIN, account_id)
     
     # What sensor would reference
-    mock_coordinator = MagicMock()
-    mock_coordinator.data = {
+    mock_coordinator = StubCoordinator(data={
         "usage_data": {
             account_id: {
                 "property": {
@@ -99,10 +90,9 @@ def test_device_identifier_matches_between_manager_and_sensor():
                 }
             }
         }
-    }
+    })
     
-    mock_config_entry = MagicMock()
-    mock_config_entry.entry_id = "different_entry_id"
+    mock_config_entry = StubEntry(entry_id="different_entry_id")
     
     sensor = RedEnergyBaseSensor(
         mock_coordinator,
@@ -115,76 +105,38 @@ def test_device_identifier_matches_between_manager_and_sensor():
     sensor_identifier = list(sensor._attr_device_info["identifiers"])[0]
     
     # They should match
-    assert device_manager_identifier == sensor_identifier
-    
-    print(f"✓ Device manager identifier: {device_manager_identifier}")
-    print(f"✓ Sensor identifier: {sensor_identifier}")
-    print("✓ Identifiers MATCH - will create single device!")
+    assert device_manager_identifier == sensor_identifier, "Identifiers must match to create a single device"
 
 
-def test_device_model_electricity_only():
-    """Test device model is 'Electricity Monitor' for electricity-only service."""
-    from custom_components.red_energy.device_manager import RedEnergyDeviceManager
-    
-    mock_hass = MagicMock()
-    mock_config_entry = MagicMock()
-    
-    device_manager = RedEnergyDeviceManager(mock_hass, mock_config_entry)
-    
-    model = device_manager._get_device_model([SERVICE_TYPE_ELECTRICITY])
-    
-    assert model == "Electricity Monitor"
-    print(f"✓ Electricity-only device model: {model}")
-
-
-def test_device_model_gas_only():
-    """Test device model is 'Gas Monitor' for gas-only service."""
-    from custom_components.red_energy.device_manager import RedEnergyDeviceManager
-    
-    mock_hass = MagicMock()
-    mock_config_entry = MagicMock()
-    
-    device_manager = RedEnergyDeviceManager(mock_hass, mock_config_entry)
-    
-    model = device_manager._get_device_model([SERVICE_TYPE_GAS])
-    
-    assert model == "Gas Monitor"
-    print(f"✓ Gas-only device model: {model}")
+@pytest.fixture(scope="module")
+def device_manager():
+    """Create a device manager shared by the module's tests."""
+    return RedEnergyDeviceManager(MagicMock(), MagicMock())
 
 
-def test_device_model_dual_service():
-    """Test device model is 'Dual Service Monitor' for both services."""
-    from custom_components.red_energy.device_manager import RedEnergyDeviceManager
-    
-    mock_hass = MagicMock()
-    mock_config_entry = MagicMock()
-    
-    device_manager = RedEnergyDeviceManager(mock_hass, mock_config_entry)
-    
-    model = device_manager._get_device_model([SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS])
-    
-    assert model == "Dual Service Monitor"
-    print(f"✓ Dual service device model: {model}")
+@pytest.mark.parametrize(
+    ("services", "expected"),
+    [
+        ([SERVICE_TYPE_ELECTRICITY], "Electricity Monitor"),
+        ([SERVICE_TYPE_GAS], "Gas Monitor"),
+        ([SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS], "Dual Service Monitor"),
+    ],
+    ids=["electricity_only", "gas_only", "dual_service"],
+)
+def test_device_model(device_manager, services, expected):
+    """Test the device model reflects the property's services."""
+    assert device_manager._get_device_model(services) == expected
 
 
 def test_migration_version():
     """Test that migration version 5 (device identifier fix) still exists."""
-    from custom_components.red_energy.config_migration import CURRENT_CONFIG_VERSION, CONFIG_VERSION_5
-
     assert CURRENT_CONFIG_VERSION >= CONFIG_VERSION_5
     assert CONFIG_VERSION_5 == 5
 
-    print(f"✓ Current config version: {CURRENT_CONFIG_VERSION}")
-    print("✓ Version 5 includes device identifier fix")
-
 
 def test_sensor_device_info_minimal():
     """Test that sensor device_info only contains identifiers, letting device_manager handle metadata."""
-    from custom_components.red_energy.sensor import RedEnergyBaseSensor
-    from custom_components.red_energy.const import SENSOR_TYPE_NMI
-    
-    mock_coordinator = MagicMock()
-    mock_coordinator.data = {
+    mock_coordinator = StubCoordinator(data={
         "usage_data": {
             "99999": {
                 "property": {
@@ -193,10 +145,9 @@ def test_sensor_device_info_minimal():
                 }
             }
         }
-    }
+    })
     
-    mock_config_entry = MagicMock()
-    mock_config_entry.entry_id = "entry_xyz"
+    mock_config_entry = StubEntry(entry_id="entry_xyz")
     
     sensor = RedEnergyBaseSensor(
         mock_coordinator,
@@ -214,10 +165,7 @@ def test_sensor_device_info_minimal():
     
     # These fields are now handled by device_manager, not sensors
     # (though sensors may still set them, they won't override device_manager)
-    
-    print("✓ Sensor device_info contains identifier")
-    print("✓ Device manager handles full device metadata (model, manufacturer, etc.)")
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v"])
@@ -14,10 +14,8 @@ from homeassistant.components.sensor import SensorStateClass
 from custom_components.red_energy.coordinator import RedEnergyDataCoordinator
 from custom_components.red_energy.data_validation import validate_usage_entry
 from custom_components.red_energy.sensor import (
-    RedEnergyDailyImportUsageSensor,
-    RedEnergyDailyExportUsageSensor,
-    RedEnergyDailyImportCostSensor,
-    RedEnergyDailyExportCreditSensor,
+    METRIC_SPEC_BY_KEY,
+    RedEnergyMetricSensor,
     RedEnergyPeakUsageSensor,
 )
 from custom_components.red_energy.const import SERVICE_TYPE_ELECTRICITY
@@ -82,14 +80,16 @@ class TestDailyEnergySensorStateClass:
     """Bug #1: daily import/export usage sensors should be TOTAL, not TOTAL_INCREASING."""
 
     def test_daily_import_usage_is_total_not_total_increasing(self, coordinator):
-        sensor = RedEnergyDailyImportUsageSensor(
-            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY["daily_import_usage"],
         )
         assert sensor.state_class == SensorStateClass.TOTAL
 
     def test_daily_export_usage_is_total_not_total_increasing(self, coordinator):
-        sensor = RedEnergyDailyExportUsageSensor(
-            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY["daily_export_usage"],
         )
         assert sensor.state_class == SensorStateClass.TOTAL
 
@@ -228,8 +228,9 @@ class TestLatestDaySelection:
             coordinator,
             [{"date": "2024-01-15", "import_usage": 99.0, "export_usage": 9.0}],
         )
-        sensor = RedEnergyDailyImportUsageSensor(
-            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY["daily_import_usage"],
         )
         assert sensor.extra_state_attributes["usage_date"] == "2024-01-15"
 
@@ -244,38 +245,41 @@ class TestDailySensorLastReset:
     """
 
     @pytest.mark.parametrize(
-        "sensor_cls",
-        [
-            RedEnergyDailyImportUsageSensor,
-            RedEnergyDailyExportUsageSensor,
-            RedEnergyDailyImportCostSensor,
-            RedEnergyDailyExportCreditSensor,
-        ],
+        "metric_key",
+        ["daily_import_usage", "daily_export_usage", "daily_import_cost", "daily_export_credit"],
     )
-    def test_last_reset_matches_usage_date(self, coordinator, sensor_cls):
+    def test_last_reset_matches_usage_date(self, coordinator, metric_key):
         _set_service_usage(
             coordinator,
             [{"date": "2024-01-15", "import_usage": 10.0, "export_usage": 2.0,
               "import_cost": 3.0, "export_credit": 0.5}],
         )
-        sensor = sensor_cls(coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY)
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY[metric_key],
+        )
 
         assert sensor.last_reset == datetime(2024, 1, 15, tzinfo=timezone.utc)
 
     def test_last_reset_moves_to_new_day_on_next_update(self, coordinator):
-        sensor = RedEnergyDailyImportUsageSensor(
-            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY["daily_import_usage"],
         )
 
-        _set_service_usage(coordinator, [{"date": "2024-01-15", "import_usage": 10.0}])
-        assert sensor.last_reset == datetime(2024, 1, 15, tzinfo=timezone.utc)
+        with patch.object(sensor, "async_write_ha_state"):
+            _set_service_usage(coordinator, [{"date": "2024-01-15", "import_usage": 10.0}])
+            sensor._handle_coordinator_update()
+            assert sensor.last_reset == datetime(2024, 1, 15, tzinfo=timezone.utc)
 
-        _set_service_usage(coordinator, [{"date": "2024-01-16", "import_usage": 4.0}])
-        assert sensor.last_reset == datetime(2024, 1, 16, tzinfo=timezone.utc)
+            _set_service_usage(coordinator, [{"date": "2024-01-16", "import_usage": 4.0}])
+            sensor._handle_coordinator_update()
+            assert sensor.last_reset == datetime(2024, 1, 16, tzinfo=timezone.utc)
 
     def test_last_reset_none_when_no_usage_data(self, coordinator):
         _set_service_usage(coordinator, [])
-        sensor = RedEnergyDailyImportUsageSensor(
-            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY
+        sensor = RedEnergyMetricSensor(
+            coordinator, _config_entry(), "prop-001", SERVICE_TYPE_ELECTRICITY,
+            METRIC_SPEC_BY_KEY["daily_import_usage"],
         )
         assert sensor.last_reset is None
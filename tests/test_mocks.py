@@ -1,9 +1,11 @@
 """Test mocking utilities for Red Energy integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import copy
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from typing import Any, Dict, List
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, NonCallableMock
 
 
 class MockRedEnergyAPI:
@@ -52,7 +54,7 @@ class MockRedEnergyAPI:
     async def authenticate(self, username: str, password: str) -> bool:
         """Mock authentication."""
         # Mock successful authentication for test credentials
-        if username == "test@example.com" and password == "testpass":
+        if (username, password) == _VALID_LOGIN:
             self._access_token = "mock-access-token"
             self._refresh_token = "mock-refresh-token"
             self._token_expires = datetime.now() + timedelta(hours=1)
@@ -79,30 +81,32 @@ class MockRedEnergyAPI:
     ) -> Dict[str, Any]:
         """Get mock usage data."""
         # Generate mock daily usage data
-        current_date = from_date
-        usage_data = []
+        days = (to_date - from_date).days + 1
+        base_ordinal = from_date.toordinal()
+        ordinals = range(base_ordinal, base_ordinal + days)
+        base_usage = 25 if "elec" in consumer_number else 45
+        unit = "kWh" if "elec" in consumer_number else "MJ"
         
-        while current_date <= to_date:
-            # Mock usage values
-            base_usage = 25 if "elec" in consumer_number else 45
-            daily_usage = base_usage + (hash(current_date.strftime("%Y%m%d")) % 20)
-            
-            usage_data.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "usage": daily_usage,
-                "cost": daily_usage * 0.28,
-                "unit": "kWh" if "elec" in consumer_number else "MJ"
-            })
-            
-            current_date += timedelta(days=1)
+        # Mock usage values, varied per day with a multiplicative hash
+        usages = [base_usage + ((ordinal * 2654435761) & 0xFFFFF) % 20 for ordinal in ordinals]
+        costs = [usage * 0.28 for usage in usages]
+        usage_data = [
+            {
+                "date": date.fromordinal(ordinal).isoformat(),
+                "usage": usage,
+                "cost": cost,
+                "unit": unit
+            }
+            for ordinal, usage, cost in zip(ordinals, usages, costs)
+        ]
         
         return {
             "consumer_number": consumer_number,
             "from_date": from_date.strftime("%Y-%m-%d"),
             "to_date": to_date.strftime("%Y-%m-%d"),
             "usage_data": usage_data,
-            "total_usage": sum(d["usage"] for d in usage_data),
-            "total_cost": sum(d["cost"] for d in usage_data)
+            "total_usage": sum(usages),
+            "total_cost": sum(costs)
         }
 
 
@@ -113,9 +117,10 @@ def create_mock_api() -> MockRedEnergyAPI:
 
 def create_mock_hass():
     """Create a mock Home Assistant instance for testing."""
-    mock_hass = MagicMock()
+    # Plain attribute holders - NonCallableMock skips MagicMock's magic method setup
+    mock_hass = NonCallableMock()
     mock_hass.data = {}
-    mock_hass.config_entries = MagicMock()
+    mock_hass.config_entries = NonCallableMock()
     mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
     mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
     return mock_hass
@@ -123,7 +128,7 @@ def create_mock_hass():
 
 def create_mock_config_entry(data=None, options=None):
     """Create a mock config entry for testing."""
-    mock_entry = MagicMock()
+    mock_entry = NonCallableMock()
     mock_entry.entry_id = "test_entry_id"
     mock_entry.data = data or {
         "username": "test@example.com",
@@ -136,73 +141,106 @@ def create_mock_config_entry(data=None, options=None):
 
 
 # Test constants
-MOCK_VALID_CREDENTIALS = {
+MOCK_VALID_CREDENTIALS = MappingProxyType({
     "username": "test@example.com",
     "password": "testpass"
-}
+})
 
-MOCK_INVALID_CREDENTIALS = {
+MOCK_INVALID_CREDENTIALS = MappingProxyType({
     "username": "invalid@example.com",
     "password": "wrongpass"
+})
+
+_VALID_LOGIN = (MOCK_VALID_CREDENTIALS["username"], MOCK_VALID_CREDENTIALS["password"])
+
+
+def _mock_usage_row(daily_usage):
+    """Build a mock usage row, leaving the date to be filled in."""
+    return {
+        "date": None,
+        "usage": daily_usage,
+        "cost": daily_usage * 0.28,
+        "import_usage": daily_usage * 0.7,
+        "export_usage": daily_usage * 0.3,
+        "import_cost": daily_usage * 0.7 * 0.28,
+        "export_credit": daily_usage * 0.3 * 0.10,
+        "peak_import": daily_usage * 0.3,
+        "offpeak_import": daily_usage * 0.5,
+        "shoulder_import": daily_usage * 0.2,
+    }
+
+
+# Row values only depend on the base usage and the day index modulo 10, so
+# each cycle of rows is built once and copied for every day generated
+_MOCK_USAGE_CYCLE = 10
+_MOCK_USAGE_ROWS = {
+    base_usage: tuple(
+        _mock_usage_row(base_usage + offset) for offset in range(_MOCK_USAGE_CYCLE)
+    )
+    for base_usage in (25, 45)
 }
 
 
-def create_mock_usage_data(property_id="prop-001", service_type="electricity", days=30):
-    """Create mock usage data for testing."""
-    from datetime import datetime, timedelta
-    
-    usage_data = []
-    start_date = datetime.now() - timedelta(days=days)
+# Service metadata is the same for every mock usage response; each gets its own copy
+_MOCK_METADATA = MappingProxyType({
+    "nmi": "1234567890",
+    "meterType": "Smart Meter",
+    "solar": True,
+    "productName": "Basic Energy Plan",
+    "linesCompany": "AusNet Services",
+    "balanceDollar": -150.50,
+    "arrearsDollar": 0.0,
+    "lastBillDate": "2024-01-01",
+    "nextBillDate": "2024-02-01",
+    "billingFrequency": "monthly",
+    "jurisdiction": "VIC",
+    "chargeClass": "RES",
+    "status": "ON",
+    "active": True
+})
+
+
+def create_mock_usage_data(
+    property_id="prop-001",
+    service_type="electricity",
+    days=30,
+    now=None,
+):
+    """Create mock usage data for testing.
+
+    Pass now to generate the data relative to an existing timestamp.
+    """
+    now = now or datetime.now()
+    start_date = now - timedelta(days=days)
+    start_ordinal = start_date.toordinal()
+    base_usage = 25 if service_type == "electricity" else 45
+    template_rows = _MOCK_USAGE_ROWS[base_usage]
     
-    for i in range(days):
-        current_date = start_date + timedelta(days=i)
-        base_usage = 25 if service_type == "electricity" else 45
-        daily_usage = base_usage + (i % 10)
-        
-        usage_data.append({
-            "date": current_date.strftime("%Y-%m-%d"),
-            "usage": daily_usage,
-            "cost": daily_usage * 0.28,
-            "import_usage": daily_usage * 0.7,
-            "export_usage": daily_usage * 0.3,
-            "import_cost": daily_usage * 0.7 * 0.28,
-            "export_credit": daily_usage * 0.3 * 0.10,
-            "peak_import": daily_usage * 0.3,
-            "offpeak_import": daily_usage * 0.5,
-            "shoulder_import": daily_usage * 0.2,
-        })
+    usage_data = [
+        {
+            **template_rows[i % _MOCK_USAGE_CYCLE],
+            "date": date.fromordinal(start_ordinal + i).isoformat(),
+        }
+        for i in range(days)
+    ]
     
     return {
         "consumer_number": f"{service_type}-123",
-        "from_date": (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d"),
-        "to_date": datetime.now().strftime("%Y-%m-%d"),
+        "from_date": start_date.strftime("%Y-%m-%d"),
+        "to_date": now.strftime("%Y-%m-%d"),
         "usage_data": usage_data,
-        "total_usage": sum(d["usage"] for d in usage_data),
-        "total_cost": sum(d["cost"] for d in usage_data),
-        "metadata": {
-            "nmi": "1234567890",
-            "meterType": "Smart Meter",
-            "solar": True,
-            "productName": "Basic Energy Plan",
-            "linesCompany": "AusNet Services",
-            "balanceDollar": -150.50,
-            "arrearsDollar": 0.0,
-            "lastBillDate": "2024-01-01",
-            "nextBillDate": "2024-02-01",
-            "billingFrequency": "monthly",
-            "jurisdiction": "VIC",
-            "chargeClass": "RES",
-            "status": "ON",
-            "active": True
-        }
+        "total_usage": sum(row["usage"] for row in usage_data),
+        "total_cost": sum(row["cost"] for row in usage_data),
+        "metadata": dict(_MOCK_METADATA),
     }
 
 
-def create_mock_coordinator_data(property_ids=None, service_types=None):
+def create_mock_coordinator_data(property_ids=None, service_types=None, now=None):
     """Create comprehensive mock coordinator data."""
     property_ids = property_ids or ["prop-001"]
     service_types = service_types or ["electricity"]
-    
+    now = now or datetime.now()
+    last_updated = now.isoformat()
     data = {"usage_data": {}}
     
     for prop_id in property_ids:
@@ -220,7 +258,7 @@ def create_mock_coordinator_data(property_ids=None, service_types=None):
         }
         
         for service_type in service_types:
-            usage_data = create_mock_usage_data(prop_id, service_type)
+            usage_data = create_mock_usage_data(prop_id, service_type, now=now)
             data["usage_data"][prop_id][service_type] = {
                 "consumer_number": usage_data["consumer_number"],
                 "usage_data": {
@@ -230,12 +268,39 @@ def create_mock_coordinator_data(property_ids=None, service_types=None):
                 },
                 "metadata": usage_data["metadata"],
                 "period_days": 30,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": last_updated
             }
     
     return data
 
 
+# Canned results for the advanced mock coordinator's calculation methods
+_ADVANCED_COORDINATOR_RESULTS = {
+    "get_total_cost": 23.24,
+    "get_total_usage": 83.0,
+    "get_total_import_usage": 83.0,
+    "get_total_export_usage": 15.0,
+    "get_total_import_cost": 23.24,
+    "get_total_export_credit": 2.10,
+    "get_net_total_cost": 21.14,
+    "get_latest_import_usage": 28.0,
+    "get_latest_export_usage": 5.0,
+    "get_latest_import_cost": 7.84,
+    "get_latest_export_credit": 0.70,
+    "get_period_import_usage": 50.0,
+    "get_period_export_usage": 10.0,
+    "get_max_demand_data": {
+        "max_demand_kw": 5.2,
+        "max_demand_time": "2024-01-15T18:30:00",
+        "max_demand_date": "2024-01-15"
+    },
+    "get_total_carbon_emission": 0.073,
+    "get_emission_factor": 0.88,
+    "get_performance_metrics": {"operations": 100},
+    "get_error_statistics": {"total_errors": 0},
+}
+
+
 def create_advanced_mock_coordinator():
     """Create an advanced mock coordinator with comprehensive data."""
     coordinator = MagicMock()
@@ -243,36 +308,22 @@ def create_advanced_mock_coordinator():
     coordinator.last_update_success = True
     
     # Add all accessor methods
-    coordinator.get_property_data = MagicMock(side_effect=lambda prop_id: 
-        coordinator.data["usage_data"].get(prop_id, {}).get("property"))
+    coordinator.get_property_data = MagicMock(
+        side_effect=lambda prop_id: coordinator.data["usage_data"].get(prop_id, {}).get("property")
+    )
     
-    coordinator.get_service_usage = MagicMock(side_effect=lambda prop_id, service_type:
-        coordinator.data["usage_data"].get(prop_id, {}).get(service_type))
+    coordinator.get_service_usage = MagicMock(
+        side_effect=lambda prop_id, service_type: coordinator.data["usage_data"].get(prop_id, {}).get(service_type)
+    )
     
-    coordinator.get_service_metadata = MagicMock(side_effect=lambda prop_id, service_type:
-        coordinator.data["usage_data"].get(prop_id, {}).get(service_type, {}).get("metadata"))
+    coordinator.get_service_metadata = MagicMock(
+        side_effect=lambda prop_id, service_type: (
+            coordinator.data["usage_data"].get(prop_id, {}).get(service_type, {}).get("metadata")
+        )
+    )
     
-    # Add calculation methods
-    coordinator.get_total_cost = MagicMock(return_value=23.24)
-    coordinator.get_total_usage = MagicMock(return_value=83.0)
-    coordinator.get_total_import_usage = MagicMock(return_value=83.0)
-    coordinator.get_total_export_usage = MagicMock(return_value=15.0)
-    coordinator.get_total_import_cost = MagicMock(return_value=23.24)
-    coordinator.get_total_export_credit = MagicMock(return_value=2.10)
-    coordinator.get_net_total_cost = MagicMock(return_value=21.14)
-    coordinator.get_latest_import_usage = MagicMock(return_value=28.0)
-    coordinator.get_latest_export_usage = MagicMock(return_value=5.0)
-    coordinator.get_latest_import_cost = MagicMock(return_value=7.84)
-    coordinator.get_latest_export_credit = MagicMock(return_value=0.70)
-    coordinator.get_period_import_usage = MagicMock(return_value=50.0)
-    coordinator.get_period_export_usage = MagicMock(return_value=10.0)
-    coordinator.get_max_demand_data = MagicMock(return_value={
-        "max_demand_kw": 5.2,
-        "max_demand_time": "2024-01-15T18:30:00",
-        "max_demand_date": "2024-01-15"
-    })
-    coordinator.get_total_carbon_emission = MagicMock(return_value=0.073)
-    coordinator.get_performance_metrics = MagicMock(return_value={"operations": 100})
-    coordinator.get_error_statistics = MagicMock(return_value={"total_errors": 0})
+    # Add calculation methods, each with its own copy of any mutable result
+    for name, value in _ADVANCED_COORDINATOR_RESULTS.items():
+        setattr(coordinator, name, MagicMock(return_value=copy.deepcopy(value)))
     
-    return coordinator
\ No newline at end of file
+    return coordinator
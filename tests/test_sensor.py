@@ -1,8 +1,11 @@
 """Comprehensive tests for Red Energy sensors."""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
 import pytest
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -20,6 +23,7 @@ from custom_components.red_energy.const import (
 )
 from custom_components.red_energy.sensor import (
     RedEnergyBaseSensor,
+    RedEnergyBillingFrequencySensor,
     RedEnergyCostSensor,
     RedEnergyDailyAverageSensor,
     RedEnergyMonthlyAverageSensor,
@@ -28,130 +32,242 @@ from custom_components.red_energy.sensor import (
     RedEnergyNmiSensor,
     RedEnergyMeterTypeSensor,
     RedEnergySolarSensor,
-    RedEnergyDailyImportUsageSensor,
-    RedEnergyDailyExportUsageSensor,
-    RedEnergyTotalImportUsageSensor,
-    RedEnergyTotalExportUsageSensor,
-    RedEnergyTotalImportCostSensor,
-    RedEnergyTotalExportCreditSensor,
-    RedEnergyPeakImportUsageSensor,
-    RedEnergyOffpeakImportUsageSensor,
-    RedEnergyShoulderImportUsageSensor,
     RedEnergyMaxDemandSensor,
     RedEnergyMaxDemandTimeSensor,
+    RedEnergyMetricSensor,
+    METRIC_SPEC_BY_KEY,
+    _format_display_name,
 )
 
 
-def create_mock_coordinator():
-    """Create a mock coordinator for testing."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "usage_data": {
-            "prop-001": {
-                "property": {
-                    "name": "Test Property",
-                    "id": "prop-001"
-                },
-                "electricity": {
-                    "consumer_number": "elec-123",
-                    "metadata": {
-                        "nmi": "1234567890",
-                        "meterType": "Smart Meter",
-                        "solar": True,
-                        "productName": "Basic Energy Plan",
-                        "linesCompany": "AusNet Services",
-                        "balanceDollar": -150.50,
-                        "arrearsDollar": 0.0,
-                        "lastBillDate": "2024-01-01",
-                        "nextBillDate": "2024-02-01",
-                        "billingFrequency": "monthly",
-                        "jurisdiction": "VIC",
-                        "chargeClass": "RES",
-                        "status": "ON"
-                    },
-                    "usage_data": {
-                        "from_date": "2024-01-01",
-                        "to_date": "2024-01-30",
-                        "usage_data": [
-                            {"date": "2024-01-01", "usage": 25.0, "cost": 7.00},
-                            {"date": "2024-01-02", "usage": 30.0, "cost": 8.40},
-                            {"date": "2024-01-03", "usage": 28.0, "cost": 7.84},
-                        ]
-                    },
-                    "period_days": 30,
-                    "last_updated": "2024-01-30T10:00:00"
-                }
-            }
-        }
-    }
-    coordinator.last_update_success = True
-    coordinator.get_service_usage = MagicMock(return_value=coordinator.data["usage_data"]["prop-001"]["electricity"])
-    coordinator.get_service_metadata = MagicMock(return_value=coordinator.data["usage_data"]["prop-001"]["electricity"]["metadata"])
-    coordinator.get_total_cost = MagicMock(return_value=23.24)
-    coordinator.get_total_usage = MagicMock(return_value=83.0)
-    coordinator.get_latest_import_usage = MagicMock(return_value=28.0)
-    coordinator.get_latest_export_usage = MagicMock(return_value=5.0)
-    coordinator.get_total_import_usage = MagicMock(return_value=83.0)
-    coordinator.get_total_export_usage = MagicMock(return_value=15.0)
-    coordinator.get_total_import_cost = MagicMock(return_value=23.24)
-    coordinator.get_total_export_credit = MagicMock(return_value=2.10)
-    coordinator.get_net_total_cost = MagicMock(return_value=21.14)
-    coordinator.get_latest_import_cost = MagicMock(return_value=7.84)
-    coordinator.get_latest_export_credit = MagicMock(return_value=0.70)
-    coordinator.get_period_import_usage = MagicMock(return_value=50.0)
-    coordinator.get_period_export_usage = MagicMock(return_value=10.0)
-    coordinator.get_max_demand_data = MagicMock(return_value={
+@dataclass
+class FakeCoordinator:
+    """Plain stand-in for the coordinator, returning canned results.
+
+    Tests change a result by setting its field, and count calls by
+    patching the method with wraps=.
+    """
+
+    data: dict[str, Any]
+    service_usage: dict[str, Any] | None
+    service_metadata: dict[str, Any] | None
+    last_update_success: bool = True
+    total_cost: float | None = 23.24
+    total_usage: float | None = 83.0
+    latest_usage_date: str | None = "2024-01-03"
+    latest_import_usage: float | None = 28.0
+    latest_export_usage: float | None = 5.0
+    total_import_usage: float | None = 83.0
+    total_export_usage: float | None = 15.0
+    total_import_cost: float | None = 23.24
+    total_export_credit: float | None = 2.10
+    net_total_cost: float | None = 21.14
+    latest_import_cost: float | None = 7.84
+    latest_export_credit: float | None = 0.70
+    period_import_usage: float | None = 50.0
+    period_export_usage: float | None = 10.0
+    max_demand_data: dict[str, Any] | None = field(default_factory=lambda: {
         "max_demand_kw": 5.2,
         "max_demand_time": "2024-01-15T18:30:00",
         "max_demand_date": "2024-01-15"
     })
-    coordinator.get_total_carbon_emission = MagicMock(return_value=0.073)
-    return coordinator
+    total_carbon_emission: float | None = 0.073
+    emission_factor: float | None = 0.88
+
+    def get_service_usage(self, *_):
+        return self.service_usage
+
+    def get_service_metadata(self, *_):
+        return self.service_metadata
+
+    def get_total_cost(self, *_):
+        return self.total_cost
+
+    def get_total_usage(self, *_):
+        return self.total_usage
+
+    def get_latest_usage_date(self, *_):
+        return self.latest_usage_date
+
+    def get_latest_import_usage(self, *_):
+        return self.latest_import_usage
+
+    def get_latest_export_usage(self, *_):
+        return self.latest_export_usage
+
+    def get_total_import_usage(self, *_):
+        return self.total_import_usage
+
+    def get_total_export_usage(self, *_):
+        return self.total_export_usage
+
+    def get_total_import_cost(self, *_):
+        return self.total_import_cost
+
+    def get_total_export_credit(self, *_):
+        return self.total_export_credit
+
+    def get_net_total_cost(self, *_):
+        return self.net_total_cost
+
+    def get_latest_import_cost(self, *_):
+        return self.latest_import_cost
+
+    def get_latest_export_credit(self, *_):
+        return self.latest_export_credit
+
+    def get_period_import_usage(self, *_):
+        return self.period_import_usage
+
+    def get_period_export_usage(self, *_):
+        return self.period_export_usage
+
+    def get_max_demand_data(self, *_):
+        return self.max_demand_data
+
+    def get_total_carbon_emission(self, *_):
+        return self.total_carbon_emission
+
+    def get_emission_factor(self, *_):
+        return self.emission_factor
+
+
+# Shared by every mock coordinator - tests that modify it must deep-copy it first
+_COORDINATOR_DATA_TEMPLATE = {
+    "usage_data": {
+        "prop-001": {
+            "property": {
+                "name": "Test Property",
+                "id": "prop-001"
+            },
+            "electricity": {
+                "consumer_number": "elec-123",
+                "metadata": {
+                    "nmi": "1234567890",
+                    "meterType": "Smart Meter",
+                    "solar": True,
+                    "productName": "Basic Energy Plan",
+                    "linesCompany": "AusNet Services",
+                    "balanceDollar": -150.50,
+                    "arrearsDollar": 0.0,
+                    "lastBillDate": "2024-01-01",
+                    "nextBillDate": "2024-02-01",
+                    "billingFrequency": "monthly",
+                    "jurisdiction": "VIC",
+                    "chargeClass": "RES",
+                    "status": "ON"
+                },
+                "usage_data": {
+                    "from_date": "2024-01-01",
+                    "to_date": "2024-01-30",
+                    "usage_data": [
+                        {"date": "2024-01-01", "usage": 25.0, "cost": 7.00},
+                        {"date": "2024-01-02", "usage": 30.0, "cost": 8.40},
+                        {"date": "2024-01-03", "usage": 28.0, "cost": 7.84},
+                    ]
+                },
+                "period_days": 30,
+                "last_updated": "2024-01-30T10:00:00"
+            },
+            "gas": {
+                "consumer_number": "gas-123",
+                "metadata": {},
+                "usage_data": {
+                    "from_date": "2024-01-01",
+                    "to_date": "2024-01-30",
+                    "usage_data": [
+                        {"date": "2024-01-01", "usage": 25.0, "cost": 7.00},
+                        {"date": "2024-01-02", "usage": 30.0, "cost": 8.40},
+                        {"date": "2024-01-03", "usage": 28.0, "cost": 7.84},
+                    ]
+                },
+                "period_days": 30,
+                "last_updated": "2024-01-30T10:00:00"
+            }
+        }
+    }
+}
+_ELECTRICITY_USAGE = _COORDINATOR_DATA_TEMPLATE["usage_data"]["prop-001"]["electricity"]
+_ENERGY_UNITS = {
+    SERVICE_TYPE_ELECTRICITY: UnitOfEnergy.KILO_WATT_HOUR,
+    SERVICE_TYPE_GAS: "MJ",
+}
+
+
+def create_mock_coordinator():
+    """Create a mock coordinator for testing."""
+    return FakeCoordinator(
+        data=_COORDINATOR_DATA_TEMPLATE,
+        service_usage=_ELECTRICITY_USAGE,
+        service_metadata=_ELECTRICITY_USAGE["metadata"],
+    )
 
 
 def create_mock_config_entry():
     """Create a mock config entry for testing."""
-    entry = MagicMock()
-    entry.entry_id = "test_entry_id"
-    entry.data = {
-        "username": "test@example.com",
-        "password": "testpass"
-    }
-    entry.options = {}
-    return entry
+    return SimpleNamespace(
+        entry_id="test_entry_id",
+        data={
+            "username": "test@example.com",
+            "password": "testpass"
+        },
+        options={},
+    )
+
+
+def _metric_sensor(key):
+    """Build a sensor factory for the metric with the given spec key."""
+    def _factory(coordinator, config_entry, property_id, service_type):
+        return RedEnergyMetricSensor(coordinator, config_entry, property_id, service_type, METRIC_SPEC_BY_KEY[key])
+    return _factory
+
 
+@pytest.fixture
+def coordinator():
+    """Provide a fresh mock coordinator for each test, as tests change its results."""
+    return create_mock_coordinator()
 
+
+@pytest.fixture(scope="session")
+def config_entry():
+    """Provide the mock config entry, which no test modifies."""
+    return create_mock_config_entry()
+
+
+@pytest.fixture(params=[SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS])
+def service_type(request, coordinator):
+    """Run the test once per service, with the coordinator serving that service's usage."""
+    usage = _COORDINATOR_DATA_TEMPLATE["usage_data"]["prop-001"][request.param]
+    coordinator.service_usage = usage
+    coordinator.service_metadata = usage["metadata"]
+    return request.param
+
+
+@pytest.mark.unit
 class TestSensorDisplayNames:
     """Test sensor display names with underscore to space conversion."""
 
-    def test_base_sensor_replaces_underscores_with_spaces(self):
+    @pytest.mark.parametrize(
+        ("sensor_type", "expected"),
+        [
+            ("daily_import_usage", "Daily Import Usage"),
+            ("total_cost", "Total Cost"),
+            ("daily_average", "Daily Average"),
+            ("peak_import_usage", "Peak Import Usage"),
+            ("carbon_emission_tonne", "Carbon Emission Tonne"),
+        ],
+    )
+    def test_display_name_replaces_underscores_with_spaces(self, sensor_type, expected):
         """Test that underscores in sensor_type are replaced with spaces in display names."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        # Test with sensor type containing underscores
-        sensor = RedEnergyBaseSensor(
-            coordinator,
-            config_entry,
-            "prop-001",
-            SERVICE_TYPE_ELECTRICITY,
-            "daily_import_usage"
-        )
-        
-        # Display name should have spaces, not underscores
-        assert "Daily Import Usage" in sensor._attr_name
-        assert "_" not in sensor._attr_name.split(" ")[-3:]  # Check last 3 words don't have underscores
+        assert _format_display_name(sensor_type) == expected
 
-    def test_base_sensor_name_has_no_account_or_service_prefix(self):
+    def test_base_sensor_name_has_no_account_or_service_prefix(self, coordinator, config_entry):
         """Entity names carry no account_id/service prefix and no address.
 
         The device (named "{account_id} - {Service}") already conveys both,
         and Home Assistant shows device name + entity name together in the
         UI, so repeating them in every entity name is redundant.
         """
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-
         sensor = RedEnergyBaseSensor(
             coordinator,
             config_entry,
@@ -164,69 +280,66 @@ class TestSensorDisplayNames:
         assert "prop-001" not in sensor._attr_name
         assert "Test Property" not in sensor._attr_name
 
-    def test_total_cost_sensor_display_name(self):
-        """Test total_cost sensor display name."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert "Total Cost" in sensor._attr_name
-        assert "Total_Cost" not in sensor._attr_name
-
-    def test_daily_average_sensor_display_name(self):
-        """Test daily_average sensor display name."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyDailyAverageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert "Daily Average" in sensor._attr_name
-        assert "_" not in sensor._attr_name.split()[-2:]  # Last two words shouldn't have underscores
-
-    def test_peak_import_usage_sensor_display_name(self):
-        """Test peak_import_usage sensor display name."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyPeakImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert "Peak Import Usage" in sensor._attr_name
-        # Check that the sensor type portion doesn't have underscores
-        assert "_import_" not in sensor._attr_name
-
-    def test_carbon_emission_tonne_sensor_display_name(self):
-        """Test carbon_emission_tonne sensor display name."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        from custom_components.red_energy.sensor import RedEnergyCarbonEmissionSensor
-        sensor = RedEnergyCarbonEmissionSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert "Carbon Emission Tonne" in sensor._attr_name
-        assert "_" not in sensor._attr_name.split()[-3:]
-
 
+@pytest.mark.integration
 class TestSensorValues:
     """Test sensor value calculations."""
 
-    def test_cost_sensor_value(self):
-        """Test cost sensor returns correct value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 23.24
-        assert sensor.native_unit_of_measurement == "AUD"
-        assert sensor.device_class == SensorDeviceClass.MONETARY
-
-    def test_daily_average_sensor_calculation(self):
+    @pytest.mark.parametrize(
+        ("sensor_factory", "expected", "expected_properties"),
+        [
+            pytest.param(
+                RedEnergyCostSensor,
+                23.24,
+                {"native_unit_of_measurement": "AUD", "device_class": SensorDeviceClass.MONETARY},
+                id="total_cost",
+            ),
+            pytest.param(RedEnergyPeakUsageSensor, 30.0, {}, id="peak_usage"),  # Max of [25.0, 30.0, 28.0]
+            pytest.param(RedEnergyNmiSensor, "1234567890", {"icon": "mdi:identifier"}, id="nmi"),
+            pytest.param(RedEnergyMeterTypeSensor, "Smart Meter", {}, id="meter_type"),
+            pytest.param(RedEnergySolarSensor, "Yes", {}, id="solar"),
+            pytest.param(
+                _metric_sensor("daily_import_usage"),
+                28.0,
+                {
+                    "device_class": SensorDeviceClass.ENERGY,
+                    "native_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+                },
+                id="daily_import_usage",
+            ),
+            pytest.param(
+                _metric_sensor("daily_export_usage"), 5.0, {"icon": "mdi:solar-power"}, id="daily_export_usage"
+            ),
+            pytest.param(
+                _metric_sensor("total_import_usage"),
+                83.0,
+                {"state_class": SensorStateClass.TOTAL},
+                id="total_import_usage",
+            ),
+            pytest.param(_metric_sensor("total_export_usage"), 15.0, {}, id="total_export_usage"),
+            pytest.param(
+                _metric_sensor("total_import_cost"),
+                23.24,
+                {"native_unit_of_measurement": "AUD"},
+                id="total_import_cost",
+            ),
+            pytest.param(_metric_sensor("total_export_credit"), 2.10, {}, id="total_export_credit"),
+            pytest.param(_metric_sensor("peak_import_usage"), 50.0, {}, id="peak_import_usage"),
+            pytest.param(_metric_sensor("offpeak_import_usage"), 50.0, {}, id="offpeak_import_usage"),
+            pytest.param(_metric_sensor("shoulder_import_usage"), 50.0, {}, id="shoulder_import_usage"),
+        ],
+    )
+    def test_native_value(self, coordinator, config_entry, sensor_factory, expected, expected_properties):
+        """Test each sensor's value and entity properties against the mock coordinator."""
+        sensor = sensor_factory(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+
+        assert sensor.native_value == expected
+        for name, value in expected_properties.items():
+            assert getattr(sensor, name) == value
+
+    def test_daily_average_sensor_calculation(self, coordinator, config_entry, service_type):
         """Test daily average sensor calculates correctly."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyDailyAverageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        sensor = RedEnergyDailyAverageSensor(coordinator, config_entry, "prop-001", service_type)
         
         # Should calculate average from usage_data
         value = sensor.native_value
@@ -234,33 +347,17 @@ class TestSensorValues:
         # Average of [25.0, 30.0, 28.0] = 27.67
         assert 27.0 <= value <= 28.0
 
-    def test_monthly_average_sensor_calculation(self):
+    def test_monthly_average_sensor_calculation(self, coordinator, config_entry, service_type):
         """Test monthly average sensor calculates correctly."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyMonthlyAverageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        sensor = RedEnergyMonthlyAverageSensor(coordinator, config_entry, "prop-001", service_type)
         
         value = sensor.native_value
         assert value is not None
         assert value > 0
 
-    def test_peak_usage_sensor_value(self):
-        """Test peak usage sensor returns max value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyPeakUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        value = sensor.native_value
-        assert value == 30.0  # Max of [25.0, 30.0, 28.0]
-
-    def test_efficiency_sensor_calculation(self):
+    def test_efficiency_sensor_calculation(self, coordinator, config_entry, service_type):
         """Test efficiency sensor calculates correctly."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyEfficiencySensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        sensor = RedEnergyEfficiencySensor(coordinator, config_entry, "prop-001", service_type)
         
         # Efficiency sensor requires at least 7 days of data, mock only has 3
         # So it returns None, which is correct behavior
@@ -271,14 +368,12 @@ class TestSensorValues:
         assert sensor.native_unit_of_measurement == "%"
 
 
+@pytest.mark.integration
 class TestSensorAttributes:
     """Test sensor extra state attributes."""
 
-    def test_cost_sensor_attributes(self):
+    def test_cost_sensor_attributes(self, coordinator, config_entry):
         """Test cost sensor has correct attributes."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         attrs = sensor.extra_state_attributes
@@ -287,11 +382,8 @@ class TestSensorAttributes:
         assert "service_type" in attrs
         assert "period" in attrs
 
-    def test_peak_usage_sensor_attributes(self):
+    def test_peak_usage_sensor_attributes(self, coordinator, config_entry):
         """Test peak usage sensor has peak date attribute."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyPeakUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         attrs = sensor.extra_state_attributes
@@ -299,11 +391,8 @@ class TestSensorAttributes:
         assert "peak_date" in attrs
         assert "peak_cost" in attrs
 
-    def test_efficiency_sensor_attributes(self):
+    def test_efficiency_sensor_attributes(self, coordinator, config_entry):
         """Test efficiency sensor has usage variation attribute."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyEfficiencySensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         attrs = sensor.extra_state_attributes
@@ -313,180 +402,81 @@ class TestSensorAttributes:
         assert "calculation_days" in attrs
 
 
+@pytest.mark.integration
 class TestMetadataSensors:
     """Test metadata sensors."""
 
-    def test_nmi_sensor(self):
-        """Test NMI sensor returns correct value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyNmiSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == "1234567890"
-        assert sensor.icon == "mdi:identifier"
+    @pytest.mark.parametrize(
+        ("frequency", "expected"),
+        [("MONTHLY", "Monthly"), ("quarterly", "Quarterly"), ("bi-monthly", "Bi-Monthly")],
+    )
+    def test_billing_frequency_sensor(self, coordinator, config_entry, frequency, expected):
+        """Test billing frequency is formatted for display, including unknown values."""
+        coordinator.service_metadata = {"billingFrequency": frequency}
 
-    def test_meter_type_sensor(self):
-        """Test meter type sensor returns correct value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyMeterTypeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == "Smart Meter"
+        sensor = RedEnergyBillingFrequencySensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
 
-    def test_solar_sensor(self):
-        """Test solar sensor returns correct value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergySolarSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == "Yes"
-
-
-class TestImportExportSensors:
-    """Test import/export sensors."""
-
-    def test_daily_import_usage_sensor(self):
-        """Test daily import usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyDailyImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 28.0
-        assert sensor.device_class == SensorDeviceClass.ENERGY
-        assert sensor.native_unit_of_measurement == UnitOfEnergy.KILO_WATT_HOUR
-
-    def test_daily_export_usage_sensor(self):
-        """Test daily export usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyDailyExportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 5.0
-        assert sensor.icon == "mdi:solar-power"
-
-    def test_total_import_usage_sensor(self):
-        """Test total import usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyTotalImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 83.0
-        assert sensor.state_class == SensorStateClass.TOTAL
-
-    def test_total_export_usage_sensor(self):
-        """Test total export usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyTotalExportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 15.0
-
-
-class TestCostCreditSensors:
-    """Test cost and credit sensors."""
-
-    def test_total_import_cost_sensor(self):
-        """Test total import cost sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyTotalImportCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 23.24
-        assert sensor.native_unit_of_measurement == "AUD"
-
-    def test_total_export_credit_sensor(self):
-        """Test total export credit sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyTotalExportCreditSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 2.10
+        assert sensor.native_value == expected
 
 
+@pytest.mark.integration
 class TestTimePeriodSensors:
     """Test time period sensors (peak, offpeak, shoulder)."""
 
-    def test_peak_import_usage_sensor(self):
-        """Test peak import usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyPeakImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+    def test_peak_import_usage_sensor(self, coordinator, config_entry):
+        """Test peak import usage sensor reports its time period."""
+        sensor = RedEnergyMetricSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY, METRIC_SPEC_BY_KEY["peak_import_usage"])
         
-        assert sensor.native_value == 50.0
         attrs = sensor.extra_state_attributes
         assert "time_period" in attrs
         assert attrs["time_period"] == "PEAK"
 
-    def test_offpeak_import_usage_sensor(self):
-        """Test offpeak import usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyOffpeakImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 50.0
+    def test_percentage_of_total(self, coordinator, config_entry):
+        """Test the time period share of total import is rounded to one decimal."""
+        coordinator.total_import_usage = 150.0
 
-    def test_shoulder_import_usage_sensor(self):
-        """Test shoulder import usage sensor."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyShoulderImportUsageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.native_value == 50.0
+        sensor = RedEnergyMetricSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY, METRIC_SPEC_BY_KEY["peak_import_usage"])
 
+        assert sensor.extra_state_attributes["percentage_of_total"] == 33.3
 
-class TestSensorAvailability:
-    """Test sensor availability logic."""
+    def test_percentage_of_total_without_total(self, coordinator, config_entry):
+        """Test the time period share is zero when there's no total import."""
+        coordinator.total_import_usage = None
 
-    def test_sensor_available_when_data_present(self):
-        """Test sensor is available when data is present."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.available is True
+        sensor = RedEnergyMetricSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY, METRIC_SPEC_BY_KEY["peak_import_usage"])
+
+        assert sensor.extra_state_attributes["percentage_of_total"] == 0.0
 
-    def test_sensor_unavailable_when_coordinator_fails(self):
-        """Test sensor is unavailable when coordinator update fails."""
-        coordinator = create_mock_coordinator()
-        coordinator.last_update_success = False
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        
-        assert sensor.available is False
 
-    def test_sensor_unavailable_when_property_missing(self):
-        """Test sensor is unavailable when property data is missing."""
-        coordinator = create_mock_coordinator()
-        coordinator.data = {"usage_data": {}}
-        config_entry = create_mock_config_entry()
+@pytest.mark.integration
+class TestSensorAvailability:
+    """Test sensor availability logic."""
+
+    @pytest.mark.parametrize(
+        ("last_update_success", "data_override", "expected"),
+        [
+            pytest.param(True, None, True, id="data_present"),
+            pytest.param(False, None, False, id="coordinator_failed"),
+            pytest.param(True, {"usage_data": {}}, False, id="property_missing"),
+        ],
+    )
+    def test_sensor_availability(self, coordinator, config_entry, last_update_success, data_override, expected):
+        """Test sensor is available only when the update succeeded and its property has data."""
+        coordinator.last_update_success = last_update_success
+        if data_override is not None:
+            coordinator.data = data_override
         
         sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
-        assert sensor.available is False
+        assert sensor.available is expected
 
 
+@pytest.mark.integration
 class TestSensorDeviceInfo:
     """Test sensor device information."""
 
-    def test_sensor_device_info_structure(self):
+    def test_sensor_device_info_structure(self, coordinator, config_entry):
         """Test sensor has correct device info structure."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         device_info = sensor.device_info
@@ -495,11 +485,8 @@ class TestSensorDeviceInfo:
         # Device name, manufacturer, and model are managed by device_manager, not sensor
         # Sensors only provide the identifier for grouping
 
-    def test_sensor_device_info_grouping(self):
+    def test_sensor_device_info_grouping(self, coordinator, config_entry):
         """Test sensors from same property are grouped."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor1 = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         sensor2 = RedEnergyNmiSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
@@ -509,67 +496,47 @@ class TestSensorDeviceInfo:
         assert device_id_1 == device_id_2
 
 
+@pytest.mark.unit
 class TestSensorUniqueIds:
     """Test sensor unique IDs."""
 
-    def test_sensor_unique_id_format(self):
+    def test_sensor_unique_id_format(self, coordinator, config_entry, service_type):
         """Test sensor unique ID has correct format."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", service_type)
         
         unique_id = sensor.unique_id
         assert unique_id is not None
         assert DOMAIN in unique_id
         assert "test_entry_id" in unique_id
         assert "prop-001" in unique_id
-        assert SERVICE_TYPE_ELECTRICITY in unique_id
+        assert service_type in unique_id
 
-    def test_different_sensors_have_different_unique_ids(self):
+    def test_different_sensors_have_different_unique_ids(self, coordinator, config_entry):
         """Test different sensors have different unique IDs."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor1 = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         sensor2 = RedEnergyNmiSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         assert sensor1.unique_id != sensor2.unique_id
 
 
-class TestGasSensors:
-    """Test gas service sensors."""
+@pytest.mark.integration
+class TestServiceUnits:
+    """Test sensor units for each service."""
 
-    def test_gas_sensor_units(self):
-        """Test gas sensors use correct units."""
-        coordinator = create_mock_coordinator()
-        # Add gas data
-        coordinator.data["usage_data"]["prop-001"]["gas"] = {
-            "consumer_number": "gas-123",
-            "metadata": {},
-            "usage_data": {"usage_data": []},
-            "period_days": 30
-        }
-        coordinator.get_service_usage = MagicMock(
-            return_value=coordinator.data["usage_data"]["prop-001"]["gas"]
-        )
-        
-        config_entry = create_mock_config_entry()
-        
-        sensor = RedEnergyDailyAverageSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_GAS)
+    def test_energy_sensor_units(self, coordinator, config_entry, service_type):
+        """Test energy sensors report kWh for electricity and MJ for gas."""
+        sensor = RedEnergyDailyAverageSensor(coordinator, config_entry, "prop-001", service_type)
         
         assert sensor.device_class == SensorDeviceClass.ENERGY
-        assert sensor.native_unit_of_measurement == "MJ"
+        assert sensor.native_unit_of_measurement == _ENERGY_UNITS[service_type]
 
 
+@pytest.mark.integration
 class TestMaxDemandSensors:
     """Test max demand sensors."""
 
-    def test_max_demand_sensor_basic_properties(self):
+    def test_max_demand_sensor_basic_properties(self, coordinator, config_entry):
         """Test max demand sensor basic properties."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         assert sensor.device_class == SensorDeviceClass.POWER
@@ -577,26 +544,20 @@ class TestMaxDemandSensors:
         assert sensor.state_class == SensorStateClass.MEASUREMENT
         assert sensor.icon == "mdi:lightning-bolt"
 
-    def test_max_demand_sensor_value(self):
+    def test_max_demand_sensor_value(self, coordinator, config_entry):
         """Test max demand sensor returns correct value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         # Test with mock data
         assert sensor.native_value == 5.2
         
         # Test with no data
-        coordinator.get_max_demand_data = MagicMock(return_value=None)
+        coordinator.max_demand_data = None
         sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         assert sensor.native_value is None
 
-    def test_max_demand_sensor_attributes(self):
+    def test_max_demand_sensor_attributes(self, coordinator, config_entry):
         """Test max demand sensor extra state attributes."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         attributes = sensor.extra_state_attributes
         
@@ -607,85 +568,67 @@ class TestMaxDemandSensors:
         assert attributes["max_demand_time"] == "2024-01-15T18:30:00"
         assert attributes["max_demand_date"] == "2024-01-15"
 
-    def test_max_demand_sensor_no_data_attributes(self):
+    def test_max_demand_sensor_no_data_attributes(self, coordinator, config_entry):
         """Test max demand sensor attributes when no data available."""
-        coordinator = create_mock_coordinator()
-        coordinator.get_max_demand_data = MagicMock(return_value=None)
-        config_entry = create_mock_config_entry()
+        coordinator.max_demand_data = None
         
         sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         attributes = sensor.extra_state_attributes
         
         assert attributes is None
 
-    def test_max_demand_time_sensor_basic_properties(self):
+    def test_max_demand_time_sensor_basic_properties(self, coordinator, config_entry):
         """Test max demand time sensor basic properties."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         assert sensor.device_class == SensorDeviceClass.TIMESTAMP
         assert sensor.icon == "mdi:clock-alert"
 
-    def test_max_demand_time_sensor_value(self):
+    def test_max_demand_time_sensor_value(self, coordinator, config_entry):
         """Test max demand time sensor returns correct datetime value."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         
         # Test with valid datetime string
-        from datetime import datetime
         expected_time = datetime.fromisoformat("2024-01-15T18:30:00")
         assert sensor.native_value == expected_time
         
         # Test with no data
-        coordinator.get_max_demand_data = MagicMock(return_value=None)
+        coordinator.max_demand_data = None
         sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         assert sensor.native_value is None
 
-    def test_max_demand_time_sensor_invalid_datetime(self):
+    def test_max_demand_time_sensor_invalid_datetime(self, coordinator, config_entry):
         """Test max demand time sensor handles invalid datetime strings."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         # Test with invalid datetime string
-        coordinator.get_max_demand_data = MagicMock(return_value={
+        coordinator.max_demand_data = {
             "max_demand_kw": 5.2,
             "max_demand_time": "invalid-datetime",
             "max_demand_date": "2024-01-15"
-        })
+        }
         
         sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         assert sensor.native_value is None
 
-    def test_max_demand_time_sensor_no_time_data(self):
+    def test_max_demand_time_sensor_no_time_data(self, coordinator, config_entry):
         """Test max demand time sensor when max_demand_time is None."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         # Test with no time data
-        coordinator.get_max_demand_data = MagicMock(return_value={
+        coordinator.max_demand_data = {
             "max_demand_kw": 5.2,
             "max_demand_time": None,
             "max_demand_date": "2024-01-15"
-        })
+        }
         
         sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
         assert sensor.native_value is None
 
-    def test_max_demand_sensors_with_real_api_data(self):
+    def test_max_demand_sensors_with_real_api_data(self, coordinator, config_entry):
         """Test max demand sensors with real API data structure from debug logs."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        
         # Mock data based on the debug log structure
-        coordinator.get_max_demand_data = MagicMock(return_value={
+        coordinator.max_demand_data = {
             "max_demand_kw": 0.014,
             "max_demand_time": "2025-10-10T16:30:00+10:00",
             "max_demand_date": "2025-10-10"
-        })
+        }
         
         # Test max demand sensor
         max_demand_sensor = RedEnergyMaxDemandSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
@@ -693,7 +636,69 @@ class TestMaxDemandSensors:
         
         # Test max demand time sensor
         max_demand_time_sensor = RedEnergyMaxDemandTimeSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
-        from datetime import datetime
         expected_time = datetime.fromisoformat("2025-10-10T16:30:00+10:00")
         assert max_demand_time_sensor.native_value == expected_time
 
+
+
+@pytest.mark.integration
+class TestServiceUsageCaching:
+    """Test the per-update cached service usage reference."""
+
+    def test_service_usage_resolved_once_between_updates(self, coordinator, config_entry):
+        """Repeated reads reuse the resolved service usage until the next update."""
+        with patch.object(
+            coordinator, "get_service_usage", wraps=coordinator.get_service_usage
+        ) as get_service_usage:
+            sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+            sensor.extra_state_attributes
+            sensor.extra_state_attributes
+
+        assert get_service_usage.call_count == 1
+
+    def test_attributes_built_once_between_updates(self, coordinator, config_entry):
+        """Repeated reads return the same attributes dict until the next update."""
+        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        attrs = sensor.extra_state_attributes
+
+        assert sensor.extra_state_attributes is attrs
+
+        with patch.object(sensor, "async_write_ha_state"):
+            sensor._handle_coordinator_update()
+
+        assert sensor.extra_state_attributes is not attrs
+        assert sensor.extra_state_attributes == attrs
+
+    def test_coordinator_update_re_resolves_service_usage(self, coordinator, config_entry):
+        """A coordinator update picks up the new service usage dict."""
+        sensor = RedEnergyCostSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY)
+        assert sensor.extra_state_attributes["consumer_number"] == "elec-123"
+
+        coordinator.service_usage = {"consumer_number": "elec-456"}
+        with patch.object(sensor, "async_write_ha_state"):
+            sensor._handle_coordinator_update()
+
+        assert sensor.extra_state_attributes["consumer_number"] == "elec-456"
+
+    def test_time_period_sensor_native_value_read_once_per_update(self, coordinator, config_entry):
+        """Value and attributes are published once per update, not on every read."""
+        with patch.object(
+            coordinator, "get_period_import_usage", wraps=coordinator.get_period_import_usage
+        ) as get_period_import_usage, patch.object(
+            coordinator, "get_total_import_usage", wraps=coordinator.get_total_import_usage
+        ) as get_total_import_usage:
+            sensor = RedEnergyMetricSensor(coordinator, config_entry, "prop-001", SERVICE_TYPE_ELECTRICITY, METRIC_SPEC_BY_KEY["peak_import_usage"])
+            assert sensor.native_value == 50.0
+            assert sensor.native_value == 50.0
+            assert sensor.extra_state_attributes["percentage_of_total"] == round(50.0 / 83.0 * 100, 1)
+            assert sensor.extra_state_attributes["percentage_of_total"] == round(50.0 / 83.0 * 100, 1)
+
+        assert get_period_import_usage.call_count == 1
+        assert get_total_import_usage.call_count == 1
+
+        coordinator.period_import_usage = 20.0
+        with patch.object(sensor, "async_write_ha_state"):
+            sensor._handle_coordinator_update()
+
+        assert sensor.native_value == 20.0
+        assert sensor.extra_state_attributes["percentage_of_total"] == round(20.0 / 83.0 * 100, 1)
@@ -7,8 +7,10 @@ import pytest
 
 from custom_components.red_energy.const import DOMAIN, SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS
 from custom_components.red_energy.sensor import (
+    METRIC_SPECS,
     RedEnergyAddressSensor,
     RedEnergyMaxDemandTimeSensor,
+    RedEnergyMetricSensor,
     RedEnergyPaymentTypeSensor,
     RedEnergyProductNameSensor,
     RedEnergySolarSensor,
@@ -101,6 +103,9 @@ async def test_electricity_only_sensors_not_created_for_gas_account():
         f"{[e.__class__.__name__ for e in electricity_only_present]}"
     )
     assert not any(isinstance(e, RedEnergySolarSensor) for e in added_entities)
+    assert {e._sensor_type for e in added_entities if isinstance(e, RedEnergyMetricSensor)} == {
+        "daily_import_usage", "total_import_usage", "daily_import_cost", "total_import_cost",
+    }
 
 
 @pytest.mark.asyncio
@@ -128,6 +133,38 @@ async def test_electricity_only_sensors_created_for_electricity_account():
     await async_setup_entry(hass, config_entry, async_add_entities)
 
     assert any(isinstance(e, RedEnergySolarSensor) for e in added_entities)
+    assert {e._sensor_type for e in added_entities if isinstance(e, RedEnergyMetricSensor)} == {
+        spec.key for spec in METRIC_SPECS
+    }
+
+
+@pytest.mark.asyncio
+async def test_advanced_metric_sensors_not_created_when_disabled():
+    """Time-of-use breakdown sensors are only created with advanced sensors enabled."""
+    coordinator = _coordinator(ELECTRICITY_SERVICE_METADATA, SERVICE_TYPE_ELECTRICITY)
+    config_entry = MagicMock()
+    config_entry.entry_id = "entry1"
+    config_entry.options = {}
+
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            "entry1": {
+                "coordinator": coordinator,
+                "selected_accounts": ["2000002"],
+                "services": [SERVICE_TYPE_ELECTRICITY],
+            }
+        }
+    }
+
+    added_entities = []
+    async_add_entities = MagicMock(side_effect=lambda entities: added_entities.extend(entities))
+
+    await async_setup_entry(hass, config_entry, async_add_entities)
+
+    assert {e._sensor_type for e in added_entities if isinstance(e, RedEnergyMetricSensor)} == {
+        spec.key for spec in METRIC_SPECS if not spec.advanced
+    }
 
 
 @pytest.mark.asyncio